@@ -2,5 +2,10 @@
 Stock Discovery Tool - Core Package
 """
 
+import logging
+
 __version__ = "1.0.0"
 
+# Library modules log per-symbol failures; stay silent unless the app configures logging
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
@@ -45,6 +45,9 @@ class Config:
     MAX_CONCURRENT_POSITIONS: int = 5
     MAX_VOLATILITY_PERCENTILE: float = 95.0  # No trade if volatility > 95th percentile
     
+    # Scanning
+    SCAN_WORKERS: int = 8  # Symbols analyzed concurrently (1 = sequential)
+    
     # Automation/Scheduling
     AUTOMATION_ENABLED: bool = False
     PRE_MARKET_SCAN_TIME: str = "09:00"  # IST
@@ -65,6 +68,7 @@ class Config:
     LLM_TEMPERATURE: float = 0.3  # Lower for consistency
     LLM_CACHE_ENABLED: bool = True  # Enable response caching
     LLM_CACHE_DURATION: int = 3600  # Cache duration in seconds (1 hour)
+    LLM_DEGRADED_MODEL: str = "llama3.2:1b-instruct-q4_K_M"  # Local Ollama fallback for news impact ('' to disable)
     
     # Symbol Loading Configuration
     # Options: 'nifty50', 'nifty100', 'nifty200', 'nifty500', 
@@ -2,12 +2,16 @@
 AI-Powered Stock Discovery Tool - Market Data Fetcher
 """
 
+import logging
 import yfinance as yf
 import pandas as pd
-from typing import Optional
+from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 
 
+logger = logging.getLogger(__name__)
+
+
 class MarketDataFetcher:
     """Fetch real-time and historical market data"""
     
@@ -21,27 +25,74 @@ class MarketDataFetcher:
             if df.empty:
                 return None
             
-            # Reset index and normalize column names
-            df = df.reset_index()
-            
-            # Handle both 'Date' and 'Datetime' columns
-            if 'Date' in df.columns:
-                df = df.rename(columns={'Date': 'datetime'})
-            elif 'Datetime' in df.columns:
-                df = df.rename(columns={'Datetime': 'datetime'})
-            
-            # Normalize all column names to lowercase
-            df.columns = [col.lower() for col in df.columns]
-            
-            return df
+            return MarketDataFetcher._normalize_history(df)
         
         except Exception as e:
-            print(f"Error fetching {symbol}: {e}")
+            logger.debug("Error fetching %s: %s", symbol, e)
             return None
     
+    @staticmethod
+    def get_multiple(symbols: List[str], period: str = "5d", interval: str = "1d") -> Dict[str, pd.DataFrame]:
+        """
+        Fetch OHLCV data for several symbols in one batched Yahoo request
+        
+        Returns a dict of symbol -> DataFrame shaped like get_stock_data();
+        symbols with no data are left out.
+        """
+        if not symbols:
+            return {}
+        
+        try:
+            raw = yf.download(list(symbols), period=period, interval=interval,
+                              group_by='ticker', progress=False)
+        except Exception as e:
+            logger.debug("Error batch fetching %s: %s", symbols, e)
+            return {}
+        
+        if raw is None or raw.empty:
+            return {}
+        
+        result = {}
+        for symbol in symbols:
+            if isinstance(raw.columns, pd.MultiIndex):
+                if symbol not in raw.columns.get_level_values(0):
+                    continue
+                df = raw[symbol]
+            else:
+                # Single-symbol downloads come back with flat columns
+                df = raw
+            
+            df = df.dropna(how='all')
+            if not df.empty:
+                result[symbol] = MarketDataFetcher._normalize_history(df)
+        
+        return result
+    
+    @staticmethod
+    def _normalize_history(df: pd.DataFrame) -> pd.DataFrame:
+        """Turn a yfinance history frame into lowercase columns with a 'datetime' column"""
+        # Reset index and normalize column names
+        df = df.reset_index()
+        
+        # Handle both 'Date' and 'Datetime' columns
+        if 'Date' in df.columns:
+            df = df.rename(columns={'Date': 'datetime'})
+        elif 'Datetime' in df.columns:
+            df = df.rename(columns={'Datetime': 'datetime'})
+        
+        # Normalize all column names to lowercase
+        df.columns = [str(col).lower() for col in df.columns]
+        
+        return df
+    
     @staticmethod
     def get_intraday_data(symbol: str) -> Optional[pd.DataFrame]:
-        """Fetch 1-minute intraday data (last 5 days max from yfinance)"""
+        """
+        Fetch 1-minute intraday data (last 5 days max from yfinance)
+        
+        The 'datetime' column is timezone-naive datetime64 and bars are sorted by it,
+        which strategies rely on.
+        """
         try:
             ticker = yf.Ticker(symbol)
             df = ticker.history(period="5d", interval="1m")
@@ -63,7 +114,11 @@ class MarketDataFetcher:
             
             # Ensure datetime is timezone-naive for easier comparison
             if 'datetime' in df.columns and pd.api.types.is_datetime64_any_dtype(df['datetime']):
-                df['datetime'] = pd.to_datetime(df['datetime']).dt.tz_localize(None)
+                df['datetime'] = df['datetime'].dt.tz_localize(None)
+                
+                # Yahoo returns bars in time order; enforce it once here so strategies don't sort
+                if not df['datetime'].is_monotonic_increasing:
+                    df = df.sort_values('datetime', ignore_index=True)
             
             return df
         
@@ -180,7 +235,7 @@ class MarketDataFetcher:
             }
         
         except Exception as e:
-            print(f"Error computing outcome for {symbol}: {e}")
+            logger.debug("Error computing outcome for %s: %s", symbol, e)
             return {
                 'mfe': 0.0,
                 'mae': 0.0,
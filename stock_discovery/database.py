@@ -11,7 +11,13 @@ import json
 class PickLedger:
     """SQLite-based storage for picks, feedback, outcomes, and learning"""
     
-    def __init__(self, db_path: str = None):
+    def __init__(self, db_path: str = None, fast_mode: bool = False):
+        """
+        Args:
+            db_path: SQLite file path, or ":memory:" for a throwaway in-memory ledger
+            fast_mode: Use a WAL journal and skip fsyncs (synchronous=OFF); only for
+                ledgers that don't need to survive a crash, such as tests
+        """
         if db_path is None:
             import os
             # Default to data/picks_ledger.db, fallback to current dir for compatibility
@@ -23,13 +29,36 @@ class PickLedger:
                 self.db_path = "picks_ledger.db"  # Fallback for backward compatibility
         else:
             self.db_path = db_path
+        
+        # ":memory:" would give every connection its own empty database, so use a
+        # named shared-cache memory database kept alive for the ledger's lifetime
+        self.fast_mode = fast_mode
+        self._memory_uri = None
+        if self.db_path == ":memory:":
+            self._memory_uri = f"file:picks_ledger_{id(self)}?mode=memory&cache=shared"
+            self._memory_anchor = sqlite3.connect(self._memory_uri, uri=True)
         self._init_db()
     
+    def connect(self) -> sqlite3.Connection:
+        """Open a new connection to the ledger database"""
+        if self._memory_uri is not None:
+            conn = sqlite3.connect(self._memory_uri, uri=True)
+        else:
+            conn = sqlite3.connect(self.db_path)
+        
+        if self.fast_mode:
+            # synchronous is per connection; journal_mode is set once in _init_db
+            conn.execute("PRAGMA synchronous=OFF")
+        return conn
+    
     def _init_db(self):
         """Create tables if not exist"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect()
         cursor = conn.cursor()
         
+        if self.fast_mode and self._memory_uri is None:
+            cursor.execute("PRAGMA journal_mode=WAL")
+        
         # Picks table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS picks (
@@ -113,7 +142,7 @@ class PickLedger:
     
     def save_pick(self, pick: Dict) -> str:
         """Store a generated pick"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect()
         cursor = conn.cursor()
         
         # Convert features to JSON-serializable format (convert bools to ints)
@@ -155,7 +184,7 @@ class PickLedger:
     def add_feedback(self, pick_id: str, took: bool, rating: int, 
                      notes: str = "", rejection_reason: str = ""):
         """Record user feedback"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -170,7 +199,7 @@ class PickLedger:
     def save_outcome(self, pick_id: str, mfe: float, mae: float, 
                      final_return: float, hit_target: bool, hit_stop: bool):
         """Store realized outcome"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -184,7 +213,7 @@ class PickLedger:
     
     def get_strategy_performance(self, strategy: str, regime: str) -> Optional[Dict]:
         """Get performance stats for a strategy in a given regime"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -208,7 +237,7 @@ class PickLedger:
     def update_strategy_performance(self, strategy: str, regime: str, 
                                     successful: bool, return_pct: float):
         """Update strategy performance tracking"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect()
         cursor = conn.cursor()
         
         # Get current stats
@@ -243,7 +272,7 @@ class PickLedger:
     
     def get_total_picks_count(self) -> int:
         """Get total number of picks generated"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect()
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM picks")
         count = cursor.fetchone()[0]
@@ -252,7 +281,7 @@ class PickLedger:
     
     def get_feature_penalty(self, feature_name: str, feature_value: str) -> float:
         """Get penalty score for a feature pattern"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -267,7 +296,7 @@ class PickLedger:
     
     def update_feature_penalty(self, feature_name: str, feature_value: str, failed: bool):
         """Update feature penalty based on outcome"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -303,7 +332,7 @@ class PickLedger:
     
     def get_picks_without_outcomes(self) -> List[Dict]:
         """Get picks that don't have outcomes yet"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -333,7 +362,7 @@ class PickLedger:
     
     def get_pick_details(self, pick_id: str) -> Optional[Dict]:
         """Get pick details by pick_id"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect()
         cursor = conn.cursor()
         
         cursor.execute("""
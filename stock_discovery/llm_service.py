@@ -5,16 +5,148 @@ Supports: OpenAI, Anthropic, Local (Ollama), with fallback to keyword-based meth
 
 import os
 import json
+import asyncio
+import importlib.util
 import hashlib
+import random
+import threading
 import time
-from typing import Dict, Optional, List, Any
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from typing import Dict, Optional, List, Any, AsyncIterator
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 
 
+# Retry policy for transient provider failures (rate limits, 5xx, timeouts). The
+# OpenAI/Anthropic SDK clients are built with max_retries=0 so this is the only layer
+RETRY_ATTEMPTS = 3
+RETRY_INITIAL_WAIT = 0.5  # seconds, doubled per attempt
+RETRY_MAX_WAIT = 8.0
+
+_RETRYABLE_ERROR_NAMES = {
+    'RateLimitError', 'APITimeoutError', 'APIConnectionError', 'InternalServerError',
+    'ConnectionError', 'Timeout', 'ConnectTimeout', 'ReadTimeout', 'TimeoutError'
+}
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Whether an error (or its cause) is transient: 429, 5xx, timeout or connection failure"""
+    while error is not None:
+        status = getattr(error, 'status_code', None)
+        if status is None:
+            status = getattr(getattr(error, 'response', None), 'status_code', None)
+        if status is not None:
+            return status == 429 or status >= 500
+        if type(error).__name__ in _RETRYABLE_ERROR_NAMES:
+            return True
+        error = error.__cause__
+    return False
+
+
+def _retry_wait(attempt: int, initial_wait: float) -> float:
+    """Exponential backoff with jitter for the given (0-based) attempt"""
+    return min(RETRY_MAX_WAIT, initial_wait * (2 ** attempt) + random.uniform(0, initial_wait))
+
+
+def _with_retry(call, attempts: int = RETRY_ATTEMPTS, initial_wait: float = RETRY_INITIAL_WAIT):
+    """Run call(), retrying transient failures; permanent errors are raised immediately"""
+    for attempt in range(attempts):
+        try:
+            return call()
+        except Exception as e:
+            if attempt == attempts - 1 or not _is_retryable(e):
+                raise
+            time.sleep(_retry_wait(attempt, initial_wait))
+
+
+async def _awith_retry(call, attempts: int = RETRY_ATTEMPTS, initial_wait: float = RETRY_INITIAL_WAIT):
+    """Async variant of _with_retry for coroutine factories"""
+    for attempt in range(attempts):
+        try:
+            return await call()
+        except Exception as e:
+            if attempt == attempts - 1 or not _is_retryable(e):
+                raise
+            await asyncio.sleep(_retry_wait(attempt, initial_wait))
+
+
+# Shared async HTTP clients (keep-alive, HTTP/2 when h2 is installed), one per event loop
+_ASYNC_HTTP: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def get_async_http():
+    """
+    Get the shared httpx.AsyncClient for the running event loop
+    
+    httpx connection pools are bound to the loop that created them, so each
+    loop gets its own client; all providers on that loop share it.
+    
+    Returns:
+        httpx.AsyncClient, or None if httpx is not installed
+    """
+    try:
+        import httpx
+    except ImportError:
+        return None
+    
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_HTTP.get(loop)
+    if client is None or client.is_closed:
+        try:
+            import h2  # noqa: F401 - enables HTTP/2 multiplexing
+            http2 = True
+        except ImportError:
+            http2 = False
+        
+        client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=httpx.Timeout(30.0, connect=3.0)
+        )
+        _ASYNC_HTTP[loop] = client
+    return client
+
+
+async def aclose_async_http():
+    """Close the shared async HTTP client for the running event loop (call before the loop exits)"""
+    client = _ASYNC_HTTP.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+# Prompt templates, bound once to str.format (filled per pick)
+_RISK_ASSESSMENT_PROMPT = """Provide a concise risk assessment for this stock pick. Identify potential failure modes, key risks, and suggest mitigation strategies. Keep it under 100 words.
+
+Pick Details:
+Symbol: {symbol}
+Strategy: {strategy}
+Conviction Score: {conviction:.1f}
+Entry Price: {entry:.2f}
+Stop Loss: {stop:.2f}
+Target: {target:.2f}""".format
+
+_MARKET_CONTEXT_PROMPT = """Interpret the market context for this stock pick. How does it fit into the broader market regime ({regime})? Are there any macro factors or sector-specific trends relevant to this trade? Keep it under 100 words.
+
+Pick Details:
+Symbol: {symbol}
+Strategy: {strategy}
+Market Regime: {regime}""".format
+
+_NEWS_IMPACT_PROMPT = """Analyze the following news articles for {symbol} and provide a concise summary of their potential impact on the stock price. Keep it under 100 words.
+
+Articles:
+{articles}""".format
+
+_NEWS_ARTICLE_LINE = "Title: {title}\nSummary: {summary}".format
+
+
 class LLMProvider(ABC):
     """Abstract base class for LLM providers"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def analyze(self, prompt: str, system_prompt: Optional[str] = None, 
                 temperature: float = 0.3, max_tokens: int = 500) -> str:
@@ -25,91 +157,166 @@ class LLMProvider(ABC):
     def is_available(self) -> bool:
         """Check if provider is available"""
         pass
+    
+    async def astream(self, prompt: str, system_prompt: Optional[str] = None,
+                      temperature: float = 0.3, max_tokens: int = 500) -> AsyncIterator[str]:
+        """Stream response text chunks (default: single chunk from analyze)"""
+        yield await asyncio.to_thread(self.analyze, prompt, system_prompt, temperature, max_tokens)
 
 
 class OpenAIProvider(LLMProvider):
-    """OpenAI GPT provider"""
+    """OpenAI GPT provider (SDK imported and client built on first request)"""
+    
+    __slots__ = ('api_key', 'model', '_client', '_async_client', '_async_http')
     
     def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4o-mini"):
         self.api_key = api_key or os.getenv("STOCK_OPENAI_API_KEY") or os.getenv("OPENAI_API_KEY")
         self.model = model
         self._client = None
-        
-        if self.api_key:
-            try:
-                from openai import OpenAI
-                self._client = OpenAI(api_key=self.api_key)
-            except ImportError:
-                pass
+        self._async_client = None
+        self._async_http = None
     
     def is_available(self) -> bool:
-        return self._client is not None and self.api_key is not None
+        # Cheap check: API key set and SDK installed, without importing it
+        return self.api_key is not None and importlib.util.find_spec("openai") is not None
+    
+    def _ensure_client(self):
+        """Import the SDK and build the sync client on first use"""
+        if self._client is None:
+            from openai import OpenAI
+            self._client = OpenAI(api_key=self.api_key, max_retries=0)
+        return self._client
     
     def analyze(self, prompt: str, system_prompt: Optional[str] = None,
                 temperature: float = 0.3, max_tokens: int = 500) -> str:
         if not self.is_available():
             raise RuntimeError("OpenAI provider not available")
         
+        client = self._ensure_client()
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
         
         try:
-            response = self._client.chat.completions.create(
+            response = _with_retry(lambda: client.chat.completions.create(
                 model=self.model,
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens
-            )
+            ))
             return response.choices[0].message.content.strip()
         except Exception as e:
-            raise RuntimeError(f"OpenAI API error: {e}")
+            raise RuntimeError(f"OpenAI API error: {e}") from e
+    
+    async def astream(self, prompt: str, system_prompt: Optional[str] = None,
+                      temperature: float = 0.3, max_tokens: int = 500) -> AsyncIterator[str]:
+        if not self.is_available():
+            raise RuntimeError("OpenAI provider not available")
+        
+        http_client = get_async_http()
+        if self._async_client is None or self._async_http is not http_client:
+            from openai import AsyncOpenAI
+            self._async_client = AsyncOpenAI(api_key=self.api_key, http_client=http_client,
+                                             max_retries=0)
+            self._async_http = http_client
+        
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        
+        try:
+            stream = await self._async_client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            raise RuntimeError(f"OpenAI API error: {e}") from e
 
 
 class AnthropicProvider(LLMProvider):
-    """Anthropic Claude provider"""
+    """Anthropic Claude provider (SDK imported and client built on first request)"""
+    
+    __slots__ = ('api_key', 'model', '_client', '_async_client', '_async_http')
     
     def __init__(self, api_key: Optional[str] = None, model: str = "claude-3-haiku-20240307"):
         self.api_key = api_key or os.getenv("STOCK_ANTHROPIC_API_KEY") or os.getenv("ANTHROPIC_API_KEY")
         self.model = model
         self._client = None
-        
-        if self.api_key:
-            try:
-                from anthropic import Anthropic
-                self._client = Anthropic(api_key=self.api_key)
-            except ImportError:
-                pass
+        self._async_client = None
+        self._async_http = None
     
     def is_available(self) -> bool:
-        return self._client is not None and self.api_key is not None
+        # Cheap check: API key set and SDK installed, without importing it
+        return self.api_key is not None and importlib.util.find_spec("anthropic") is not None
+    
+    def _ensure_client(self):
+        """Import the SDK and build the sync client on first use"""
+        if self._client is None:
+            from anthropic import Anthropic
+            self._client = Anthropic(api_key=self.api_key, max_retries=0)
+        return self._client
     
     def analyze(self, prompt: str, system_prompt: Optional[str] = None,
                 temperature: float = 0.3, max_tokens: int = 500) -> str:
         if not self.is_available():
             raise RuntimeError("Anthropic provider not available")
         
+        client = self._ensure_client()
         try:
-            response = self._client.messages.create(
+            response = _with_retry(lambda: client.messages.create(
                 model=self.model,
                 max_tokens=max_tokens,
                 temperature=temperature,
                 system=system_prompt or "You are a financial analyst assistant.",
                 messages=[{"role": "user", "content": prompt}]
-            )
+            ))
             return response.content[0].text.strip()
         except Exception as e:
-            raise RuntimeError(f"Anthropic API error: {e}")
+            raise RuntimeError(f"Anthropic API error: {e}") from e
+    
+    async def astream(self, prompt: str, system_prompt: Optional[str] = None,
+                      temperature: float = 0.3, max_tokens: int = 500) -> AsyncIterator[str]:
+        if not self.is_available():
+            raise RuntimeError("Anthropic provider not available")
+        
+        http_client = get_async_http()
+        if self._async_client is None or self._async_http is not http_client:
+            from anthropic import AsyncAnthropic
+            self._async_client = AsyncAnthropic(api_key=self.api_key, http_client=http_client,
+                                                max_retries=0)
+            self._async_http = http_client
+        
+        try:
+            async with self._async_client.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                system=system_prompt or "You are a financial analyst assistant.",
+                messages=[{"role": "user", "content": prompt}]
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+        except Exception as e:
+            raise RuntimeError(f"Anthropic API error: {e}") from e
 
 
 class LocalOllamaProvider(LLMProvider):
     """Local Ollama provider (free, runs on your machine)"""
     
+    __slots__ = ('base_url', 'model', '_available')
+    
     def __init__(self, base_url: str = "http://localhost:11434", model: str = "llama2"):
         self.base_url = base_url
         self.model = model
-        self._available = self._check_availability()
+        self._available = None  # Probed lazily on first is_available() call
     
     def _check_availability(self) -> bool:
         try:
@@ -120,6 +327,8 @@ class LocalOllamaProvider(LLMProvider):
             return False
     
     def is_available(self) -> bool:
+        if self._available is None:
+            self._available = self._check_availability()
         return self._available
     
     def analyze(self, prompt: str, system_prompt: Optional[str] = None,
@@ -133,34 +342,101 @@ class LocalOllamaProvider(LLMProvider):
             if system_prompt:
                 full_prompt = f"{system_prompt}\n\n{prompt}"
             
-            response = requests.post(
+            def _generate():
+                response = requests.post(
+                    f"{self.base_url}/api/generate",
+                    json={
+                        "model": self.model,
+                        "prompt": full_prompt,
+                        "stream": False,
+                        "options": {
+                            "temperature": temperature,
+                            "num_predict": max_tokens
+                        }
+                    },
+                    timeout=30
+                )
+                response.raise_for_status()
+                return response
+            
+            response = _with_retry(_generate)
+            return response.json().get("response", "").strip()
+        except Exception as e:
+            raise RuntimeError(f"Ollama API error: {e}") from e
+    
+    async def astream(self, prompt: str, system_prompt: Optional[str] = None,
+                      temperature: float = 0.3, max_tokens: int = 500) -> AsyncIterator[str]:
+        if not self.is_available():
+            raise RuntimeError("Ollama provider not available")
+        
+        http_client = get_async_http()
+        if http_client is None:
+            # No httpx - fall back to a single chunk from the blocking call
+            async for chunk in super().astream(prompt, system_prompt, temperature, max_tokens):
+                yield chunk
+            return
+        
+        try:
+            full_prompt = prompt
+            if system_prompt:
+                full_prompt = f"{system_prompt}\n\n{prompt}"
+            
+            async with http_client.stream(
+                "POST",
                 f"{self.base_url}/api/generate",
                 json={
                     "model": self.model,
                     "prompt": full_prompt,
-                    "stream": False,
+                    "stream": True,
                     "options": {
                         "temperature": temperature,
                         "num_predict": max_tokens
                     }
-                },
-                timeout=30
-            )
-            response.raise_for_status()
-            return response.json().get("response", "").strip()
+                }
+            ) as response:
+                response.raise_for_status()
+                
+                # Ollama streams one JSON object per line
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    data = json.loads(line)
+                    if data.get("response"):
+                        yield data["response"]
+                    if data.get("done"):
+                        break
         except Exception as e:
-            raise RuntimeError(f"Ollama API error: {e}")
+            raise RuntimeError(f"Ollama API error: {e}") from e
 
 
 class LLMService:
     """Main LLM service with caching and fallback"""
     
+    __slots__ = ('enabled', 'cache_enabled', 'cache_duration', 'cache_max_entries', '_cache',
+                 '_cache_lock', '_inflight', 'provider', '_available', '_availability_probe',
+                 '_availability_lock', '_degraded_provider', '_degraded_available',
+                 '_degraded_probe', 'primary_timeout', '_executor')
+    
+    DEFAULT_DEGRADED_MODEL = "llama3.2:1b-instruct-q4_K_M"
+    # Degraded answers are only a stopgap; keep them briefly and apart from primary ones
+    DEGRADED_CACHE_DURATION = 300
+    # Provider calls under a deadline; sized for the scanner's default SCAN_WORKERS
+    EXECUTOR_WORKERS = 8
+    
     def __init__(self, provider: Optional[str] = None, model: Optional[str] = None,
-                 enabled: bool = True, cache_enabled: bool = True, cache_duration: int = 3600):
+                 enabled: bool = True, cache_enabled: bool = True, cache_duration: int = 3600,
+                 cache_max_entries: int = 4096, degraded_model: Optional[str] = None,
+                 primary_timeout: float = 3.0):
         self.enabled = enabled
         self.cache_enabled = cache_enabled
         self.cache_duration = cache_duration
-        self._cache: Dict[str, tuple] = {}  # hash -> (response, timestamp)
+        self.cache_max_entries = cache_max_entries
+        # LRU cache: hash -> (response, monotonic timestamp), oldest entries first
+        self._cache: OrderedDict[str, tuple] = OrderedDict()
+        # Guards _cache across threads (thread pools, asyncio.to_thread); held only for dict ops
+        self._cache_lock = threading.Lock()
+        # In-flight async requests: hash -> future resolved with the response
+        self._inflight: Dict[str, asyncio.Future] = {}
         
         # Determine provider
         provider = provider or os.getenv("STOCK_LLM_PROVIDER", "openai").lower()
@@ -176,35 +452,138 @@ class LLMService:
         else:
             self.provider = None
         
-        # Check availability
-        self.available = self.enabled and self.provider is not None and self.provider.is_available()
+        # Shared by the availability probes and deadline-bound primary requests
+        self._executor = ThreadPoolExecutor(max_workers=self.EXECUTOR_WORKERS,
+                                            thread_name_prefix="llm")
+        
+        # Probe availability on a worker thread - the Ollama check is a blocking
+        # HTTP GET, so it overlaps with the rest of start-up until first needed
+        self._available: Optional[bool] = None
+        self._availability_probe = None
+        # Scan threads can make the first .available read concurrently
+        self._availability_lock = threading.Lock()
+        if self.enabled and self.provider is not None:
+            self._availability_probe = self._executor.submit(self.provider.is_available)
+        else:
+            self._resolve_availability()
+        
+        # Degraded tier: small quantized local model for routine summaries when the
+        # primary provider is slow or failing ('' or 'none' disables it)
+        if degraded_model is None:
+            degraded_model = os.getenv("STOCK_LLM_DEGRADED_MODEL", self.DEFAULT_DEGRADED_MODEL)
+        if degraded_model and degraded_model.lower() != "none":
+            self.degraded_provider = LocalOllamaProvider(model=degraded_model)
+        else:
+            self.degraded_provider = None
+        self.primary_timeout = primary_timeout
+    
+    def _resolve_availability(self) -> bool:
+        """Wait for the availability probe (if any) and record the result"""
+        with self._availability_lock:
+            # Another thread may have resolved it while this one waited for the lock
+            if self._available is not None:
+                return self._available
+            
+            probe = self._availability_probe
+            available = False
+            if probe is not None:
+                try:
+                    available = bool(probe.result())
+                except Exception:
+                    available = False
+                self._availability_probe = None
+            
+            self._available = self.enabled and available
+            
+            if not self._available and self.enabled:
+                print("⚠️  LLM service not available - falling back to keyword-based methods")
+            
+            return self._available
+    
+    @property
+    def available(self) -> bool:
+        """Whether the configured provider can serve requests"""
+        if self._available is None:
+            return self._resolve_availability()
+        return self._available
+    
+    @available.setter
+    def available(self, value: bool):
+        with self._availability_lock:
+            self._available = value
+            self._availability_probe = None
+    
+    @property
+    def degraded_provider(self) -> Optional[LLMProvider]:
+        """Fallback provider for _analyze_with_degraded_fallback (None disables the tier)"""
+        return self._degraded_provider
+    
+    @degraded_provider.setter
+    def degraded_provider(self, provider: Optional[LLMProvider]):
+        with self._availability_lock:
+            self._degraded_provider = provider
+            self._degraded_available = None
+            # Probed in the background like the primary; a disabled service probes on first use
+            self._degraded_probe = None
+            if provider is not None and self.enabled:
+                self._degraded_probe = self._executor.submit(provider.is_available)
+    
+    def _degraded_tier_available(self) -> bool:
+        """Whether the degraded provider can serve requests, resolved once"""
+        if self._degraded_available is not None:
+            return self._degraded_available
         
-        if not self.available and self.enabled:
-            print("⚠️  LLM service not available - falling back to keyword-based methods")
+        with self._availability_lock:
+            if self._degraded_available is None:
+                try:
+                    if self._degraded_probe is not None:
+                        available = bool(self._degraded_probe.result())
+                    else:
+                        available = bool(self._degraded_provider.is_available())
+                except Exception:
+                    available = False
+                self._degraded_probe = None
+                self._degraded_available = available
+            return self._degraded_available
     
     def _cache_key(self, prompt: str, system_prompt: Optional[str] = None) -> str:
         """Generate cache key from prompt"""
         content = f"{system_prompt or ''}|{prompt}"
         return hashlib.md5(content.encode()).hexdigest()
     
-    def _get_cached(self, cache_key: str) -> Optional[str]:
-        """Get cached response if available and not expired"""
-        if not self.cache_enabled or cache_key not in self._cache:
-            return None
-        
-        response, timestamp = self._cache[cache_key]
-        age = time.time() - timestamp
-        
-        if age > self.cache_duration:
-            del self._cache[cache_key]
+    def _get_cached(self, cache_key: str, max_age: Optional[float] = None) -> Optional[str]:
+        """Get cached response if available and no older than max_age (default cache_duration)"""
+        if not self.cache_enabled:
             return None
         
-        return response
+        with self._cache_lock:
+            entry = self._cache.get(cache_key)
+            if entry is None:
+                return None
+            
+            response, timestamp = entry
+            age = time.monotonic() - timestamp
+            
+            if age > (self.cache_duration if max_age is None else max_age):
+                del self._cache[cache_key]
+                return None
+            
+            self._cache.move_to_end(cache_key)
+            return response
     
     def _cache_response(self, cache_key: str, response: str):
-        """Cache response"""
+        """Cache response, evicting the least recently used entry when full"""
         if self.cache_enabled:
-            self._cache[cache_key] = (response, time.time())
+            with self._cache_lock:
+                self._cache[cache_key] = (response, time.monotonic())
+                self._cache.move_to_end(cache_key)
+                if len(self._cache) > self.cache_max_entries:
+                    self._cache.popitem(last=False)
+    
+    def _cache_late_response(self, cache_key: str, future):
+        """Done-callback for a primary request that missed its deadline: keep its answer"""
+        if not future.cancelled() and future.exception() is None:
+            self._cache_response(cache_key, future.result())
     
     def analyze(self, prompt: str, system_prompt: Optional[str] = None,
                 temperature: float = 0.3, max_tokens: int = 500,
@@ -237,24 +616,173 @@ class LLMService:
             print(f"⚠️  LLM analysis error: {e}")
             return None
     
+    def _analyze_with_degraded_fallback(self, prompt: str, system_prompt: Optional[str] = None,
+                                        temperature: float = 0.3, max_tokens: int = 500) -> Optional[str]:
+        """
+        Analyze with the primary provider under a deadline, falling back to the degraded tier
+        
+        The degraded tier also serves requests while the primary provider is unavailable.
+        If the degraded tier can't answer, the primary request (if any) is awaited after all.
+        Degraded answers are cached under their own short-lived key, so they never
+        shadow the primary; a primary answer that arrives late is still cached.
+        
+        Returns:
+            LLM response string, or None if both tiers fail
+        """
+        if self.degraded_provider is None:
+            return self.analyze(prompt, system_prompt, temperature, max_tokens)
+        
+        primary_available = self.available
+        if not primary_available and not self.enabled:
+            return None
+        
+        cache_key = self._cache_key(prompt, system_prompt)
+        cached = self._get_cached(cache_key)
+        if cached:
+            return cached
+        
+        future = None
+        if primary_available:
+            future = self._executor.submit(self.provider.analyze, prompt, system_prompt,
+                                           temperature, max_tokens)
+            try:
+                response = future.result(timeout=self.primary_timeout)
+                self._cache_response(cache_key, response)
+                return response
+            except FuturesTimeoutError:
+                reason = "timed out"
+                # The request keeps running (and is paid for) - cache its answer when it lands
+                future.add_done_callback(lambda done: self._cache_late_response(cache_key, done))
+            except Exception as e:
+                reason = str(e)
+                future = None  # Failed outright, nothing to wait for
+        else:
+            reason = "unavailable"
+        
+        degraded_key = f"degraded:{cache_key}"
+        response = self._get_cached(degraded_key, self.DEGRADED_CACHE_DURATION)
+        if response:
+            return response
+        
+        print(f"⚠️  Primary LLM {reason}, using degraded model {self.degraded_provider.model}")
+        try:
+            if self._degraded_tier_available():
+                response = self.degraded_provider.analyze(prompt, system_prompt, temperature, max_tokens)
+        except Exception as e:
+            print(f"⚠️  Degraded LLM error: {e}")
+        
+        if response is not None:
+            self._cache_response(degraded_key, response)
+            return response
+        
+        if future is not None:
+            # Degraded tier couldn't answer - the slow primary is still the best bet
+            # (its done-callback caches the answer)
+            try:
+                return future.result()
+            except Exception as e:
+                print(f"⚠️  LLM analysis error: {e}")
+        
+        return None
+    
+    async def aanalyze(self, prompt: str, system_prompt: Optional[str] = None,
+                       temperature: float = 0.3, max_tokens: int = 500,
+                       use_cache: bool = True) -> Optional[str]:
+        """
+        Async analyze with caching and in-flight request coalescing
+        
+        Concurrent calls with the same prompt share a single provider request.
+        
+        Returns:
+            LLM response string, or None if unavailable
+        """
+        if not self.available:
+            return None
+        
+        cache_key = self._cache_key(prompt, system_prompt)
+        if use_cache:
+            cached = self._get_cached(cache_key)
+            if cached:
+                return cached
+        
+        # Join an identical request that is already running; setdefault decides ownership
+        future = asyncio.get_running_loop().create_future()
+        inflight = self._inflight.setdefault(cache_key, future)
+        if inflight is not future:
+            return await asyncio.shield(inflight)
+        
+        response = None
+        try:
+            async def _collect():
+                chunks = [chunk async for chunk in self.provider.astream(prompt, system_prompt, temperature, max_tokens)]
+                return "".join(chunks).strip()
+            
+            # Transient failures (429/5xx/timeouts) restart the request with backoff
+            response = await _awith_retry(_collect)
+            
+            if use_cache:
+                self._cache_response(cache_key, response)
+        except Exception as e:
+            print(f"⚠️  LLM analysis error: {e}")
+            response = None
+        finally:
+            del self._inflight[cache_key]
+            future.set_result(response)
+        
+        return response
+    
+    async def astream_analyze(self, prompt: str, system_prompt: Optional[str] = None,
+                              temperature: float = 0.3, max_tokens: int = 500,
+                              use_cache: bool = True) -> AsyncIterator[str]:
+        """
+        Stream LLM response chunks as they are generated
+        
+        The full response is cached once the stream completes, so a later
+        analyze() call with the same prompt is served from cache.
+        
+        Yields:
+            Response text chunks (nothing if unavailable or on error)
+        """
+        if not self.available:
+            return
+        
+        cache_key = self._cache_key(prompt, system_prompt)
+        if use_cache:
+            cached = self._get_cached(cache_key)
+            if cached:
+                yield cached
+                return
+        
+        chunks = []
+        try:
+            async for chunk in self.provider.astream(prompt, system_prompt, temperature, max_tokens):
+                chunks.append(chunk)
+                yield chunk
+        except Exception as e:
+            print(f"⚠️  LLM streaming error: {e}")
+            return
+        
+        if use_cache and chunks:
+            self._cache_response(cache_key, "".join(chunks).strip())
+    
     def clear_cache(self):
         """Clear the cache"""
-        self._cache.clear()
+        with self._cache_lock:
+            self._cache.clear()
     
     def generate_risk_assessment(self, pick: Dict) -> Optional[str]:
         """Generate risk assessment for a stock pick"""
         if not self.available:
             return None
         
-        prompt = f"""Provide a concise risk assessment for this stock pick. Identify potential failure modes, key risks, and suggest mitigation strategies. Keep it under 100 words.
-
-Pick Details:
-Symbol: {pick.get('symbol', 'N/A')}
-Strategy: {pick.get('strategy', 'N/A')}
-Conviction Score: {pick.get('conviction_score', 0):.1f}
-Entry Price: {pick.get('entry_price', 0):.2f}
-Stop Loss: {pick.get('stop_loss', 0):.2f}
-Target: {pick.get('target', 0):.2f}"""
+        prompt = _RISK_ASSESSMENT_PROMPT(
+            symbol=pick.get('symbol', 'N/A'),
+            strategy=pick.get('strategy', 'N/A'),
+            conviction=pick.get('conviction_score', 0),
+            entry=pick.get('entry_price', 0),
+            stop=pick.get('stop_loss', 0),
+            target=pick.get('target', 0)
+        )
         
         system_prompt = "You are a seasoned risk manager providing critical insights for a trade."
         
@@ -269,12 +797,11 @@ Target: {pick.get('target', 0):.2f}"""
         if not self.available:
             return None
         
-        prompt = f"""Interpret the market context for this stock pick. How does it fit into the broader market regime ({regime})? Are there any macro factors or sector-specific trends relevant to this trade? Keep it under 100 words.
-
-Pick Details:
-Symbol: {pick.get('symbol', 'N/A')}
-Strategy: {pick.get('strategy', 'N/A')}
-Market Regime: {regime}"""
+        prompt = _MARKET_CONTEXT_PROMPT(
+            symbol=pick.get('symbol', 'N/A'),
+            strategy=pick.get('strategy', 'N/A'),
+            regime=regime
+        )
         
         system_prompt = "You are a macro analyst providing a concise market context for a trade."
         
@@ -286,22 +813,20 @@ Market Regime: {regime}"""
     
     def generate_news_impact(self, symbol: str, news_articles: List[Dict] = None) -> Optional[str]:
         """Generate news impact summary for a stock"""
-        if not self.available:
+        # The degraded tier can still answer while the primary provider is down
+        if not self.available and (self.degraded_provider is None or not self.enabled):
             return None
         
         if not news_articles:
             return None
         
-        article_texts = [f"Title: {a.get('title', '')}\nSummary: {a.get('summary', '')}" for a in news_articles[:5]]
-        prompt = f"""Analyze the following news articles for {symbol} and provide a concise summary of their potential impact on the stock price. Keep it under 100 words.
-
-Articles:
-{chr(10).join(article_texts)}"""
+        article_texts = [_NEWS_ARTICLE_LINE(title=a.get('title', ''), summary=a.get('summary', '')) for a in news_articles[:5]]
+        prompt = _NEWS_IMPACT_PROMPT(symbol=symbol, articles="\n".join(article_texts))
         
         system_prompt = "You are a financial news analyst providing objective analysis of news impact on stock prices."
         
         try:
-            return self.analyze(prompt, system_prompt, temperature=0.3, max_tokens=200)
+            return self._analyze_with_degraded_fallback(prompt, system_prompt, temperature=0.3, max_tokens=200)
         except Exception as e:
             print(f"⚠️  LLM news impact failed: {e}")
             return None
@@ -5,11 +5,57 @@ Enhanced with LLM for advanced sentiment analysis
 """
 
 import feedparser
+import hashlib
+import json
+import logging
 import re
-from typing import Optional, Dict, List
+import requests
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
+from urllib.parse import quote_plus
 import time
 
+try:
+    import orjson as _json  # C-accelerated JSON parsing
+except ImportError:
+    import json as _json
+
+logger = logging.getLogger(__name__)
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _extract_json_object(text: str) -> Optional[Dict]:
+    """
+    Extract the first JSON object from an LLM response
+    
+    Tolerates leading/trailing prose or markdown fences around the object.
+    Returns None if the response has no '{'; raises ValueError if malformed.
+    """
+    start = text.find('{')
+    if start < 0:
+        return None
+    
+    candidate = text[start:].rstrip()
+    if candidate.endswith('}'):
+        # Common case: object runs to the end of the response
+        try:
+            result = _json.loads(candidate.encode())
+            if isinstance(result, dict):
+                return result
+        except ValueError:
+            pass
+    
+    # Trailing prose (or stray braces) - decode just the leading object
+    result, _ = _JSON_DECODER.raw_decode(candidate)
+    if not isinstance(result, dict):
+        raise ValueError("LLM response JSON is not an object")
+    return result
+
 
 class NewsFetcher:
     """Fetch news and calculate sentiment for stocks"""
@@ -32,17 +78,33 @@ class NewsFetcher:
         'financial results', 'revenue', 'profit', 'eps'
     ]
     
-    def __init__(self, cache_duration_minutes: int = 30, llm_service=None):
+    # Google News RSS search (query is URL-encoded)
+    NEWS_RSS_URL = "https://news.google.com/rss/search?q={query}&hl=en-IN&gl=IN&ceid=IN:en"
+    
+    # Batch LLM sentiment limits (symbols per prompt, articles per symbol, output tokens per symbol)
+    BATCH_MAX_SYMBOLS = 10
+    BATCH_ARTICLES_PER_SYMBOL = 3
+    BATCH_TOKENS_PER_SYMBOL = 150
+    
+    def __init__(self, cache_duration_minutes: int = 30, llm_service=None, cache_max_entries: int = 4096):
         """
         Initialize news fetcher
         
         Args:
             cache_duration_minutes: How long to cache news (default 30 min)
             llm_service: Optional LLMService instance for advanced analysis
+            cache_max_entries: Maximum symbols kept in the news cache (LRU eviction)
         """
         self.cache_duration = timedelta(minutes=cache_duration_minutes)
-        self._cache = {}  # symbol -> (timestamp, news_data)
+        self.cache_max_entries = cache_max_entries
+        # symbol -> (monotonic timestamp, etag, last_modified, body digest, articles)
+        self._cache: OrderedDict[str, tuple] = OrderedDict()
+        self._cache_lock = threading.Lock()  # Held only for cache dict ops, never across HTTP calls
         self.llm_service = llm_service
+        
+        # Pooled HTTP session for keep-alive across symbols
+        self._session = requests.Session()
+        self._session.headers.update({'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'})
     
     def get_stock_news(self, symbol: str, max_articles: int = 10) -> List[Dict]:
         """
@@ -60,39 +122,67 @@ class NewsFetcher:
         
         # Check cache
         cache_key = search_symbol
-        if cache_key in self._cache:
-            cached_time, cached_data = self._cache[cache_key]
-            if datetime.now() - cached_time < self.cache_duration:
-                return cached_data
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None and time.monotonic() - cached[0] < self.cache_duration.total_seconds():
+                self._cache.move_to_end(cache_key)
+                return cached[4][:max_articles]
         
         try:
             # Google News RSS URL
             # Search for stock symbol + "stock" or "share" to get relevant news
-            from urllib.parse import quote_plus
-            query = f"{search_symbol} stock India"
-            encoded_query = quote_plus(query)
-            url = f"https://news.google.com/rss/search?q={encoded_query}&hl=en-IN&gl=IN&ceid=IN:en"
+            url = self.NEWS_RSS_URL.format(query=quote_plus(f"{search_symbol} stock India"))
             
-            # Parse RSS feed
-            feed = feedparser.parse(url)
+            # Conditional GET: revalidate an expired entry instead of refetching blindly
+            headers = {}
+            etag, last_modified, digest = None, None, None
+            if cached is not None:
+                _, etag, last_modified, digest, _ = cached
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
             
-            articles = []
-            for entry in feed.entries[:max_articles]:
-                article = {
-                    'title': entry.get('title', ''),
-                    'link': entry.get('link', ''),
-                    'published': entry.get('published', ''),
-                    'summary': entry.get('summary', entry.get('title', ''))
-                }
-                articles.append(article)
+            response = self._session.get(url, headers=headers, timeout=10)
             
-            # Cache results
-            self._cache[cache_key] = (datetime.now(), articles)
+            if response.status_code == 304 and cached is not None:
+                # Feed unchanged - reuse parsed articles
+                articles = cached[4]
+            else:
+                response.raise_for_status()
+                body = response.content
+                body_digest = hashlib.blake2b(body, digest_size=8).digest()
+                
+                if cached is not None and body_digest == digest:
+                    # Same bytes as last time - skip the (slow) feedparser parse
+                    articles = cached[4]
+                else:
+                    feed = feedparser.parse(body)
+                    articles = []
+                    for entry in feed.entries:
+                        article = {
+                            'title': entry.get('title', ''),
+                            'link': entry.get('link', ''),
+                            'published': entry.get('published', ''),
+                            'summary': entry.get('summary', entry.get('title', ''))
+                        }
+                        articles.append(article)
+                
+                digest = body_digest
+                etag = response.headers.get('ETag', etag)
+                last_modified = response.headers.get('Last-Modified', last_modified)
+            
+            # Cache results (evict least recently used symbol when full)
+            with self._cache_lock:
+                self._cache[cache_key] = (time.monotonic(), etag, last_modified, digest, articles)
+                self._cache.move_to_end(cache_key)
+                if len(self._cache) > self.cache_max_entries:
+                    self._cache.popitem(last=False)
             
-            return articles
+            return articles[:max_articles]
         
         except Exception as e:
-            print(f"⚠️  News fetch error for {symbol}: {e}")
+            logger.debug("News fetch error for %s: %s", symbol, e)
             return []
     
     def calculate_sentiment(self, articles: List[Dict], symbol: str = "") -> Dict:
@@ -158,14 +248,10 @@ Provide sentiment analysis in JSON format."""
             
             if response:
                 # Try to parse JSON response
-                import json
                 try:
                     # Extract JSON from response (might have markdown formatting)
-                    json_start = response.find('{')
-                    json_end = response.rfind('}') + 1
-                    if json_start >= 0 and json_end > json_start:
-                        result = json.loads(response[json_start:json_end])
-                        
+                    result = _extract_json_object(response)
+                    if result is not None:
                         return {
                             'polarity': float(result.get('polarity', 0.0)),
                             'confidence': float(result.get('confidence', 0.5)),
@@ -196,6 +282,107 @@ Provide sentiment analysis in JSON format."""
         
         return None
     
+    def batch_calculate_sentiment(self, symbol_to_articles: Dict[str, List[Dict]],
+                                  max_tokens: int = 1500) -> Dict[str, Dict]:
+        """
+        Calculate sentiment for many symbols, packing several symbols into each LLM prompt
+        
+        Args:
+            symbol_to_articles: Dict of symbol -> list of news article dicts
+            max_tokens: Output token budget per LLM call (limits symbols per chunk)
+        
+        Returns:
+            Dict of symbol -> sentiment dict (same shape as calculate_sentiment)
+        """
+        results = {}
+        pending = {}
+        
+        for symbol, articles in symbol_to_articles.items():
+            if articles:
+                pending[symbol] = articles
+            else:
+                results[symbol] = self.calculate_sentiment(articles, symbol=symbol)
+        
+        if not pending:
+            return results
+        
+        # Without LLM there is nothing to batch - keyword analysis is local
+        if not (self.llm_service and self.llm_service.available):
+            for symbol, articles in pending.items():
+                results[symbol] = self._calculate_sentiment_keywords(articles)
+            return results
+        
+        # Chunk symbols so each prompt stays within the output token budget
+        chunk_size = max(1, min(self.BATCH_MAX_SYMBOLS, max_tokens // self.BATCH_TOKENS_PER_SYMBOL))
+        symbols = list(pending)
+        chunks = [symbols[i:i + chunk_size] for i in range(0, len(symbols), chunk_size)]
+        
+        # Run chunks in parallel (LLM calls are I/O-bound)
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            chunk_results = list(executor.map(
+                lambda chunk: self._batch_sentiment_llm({s: pending[s] for s in chunk}),
+                chunks
+            ))
+        
+        for chunk, batch in zip(chunks, chunk_results):
+            for symbol in chunk:
+                sentiment = batch.get(symbol) if batch else None
+                if sentiment is None:
+                    # Batch parse failed or symbol missing - fall back to per-symbol call
+                    sentiment = self.calculate_sentiment(pending[symbol], symbol=symbol)
+                results[symbol] = sentiment
+        
+        return results
+    
+    def _batch_sentiment_llm(self, symbol_to_articles: Dict[str, List[Dict]]) -> Optional[Dict[str, Dict]]:
+        """Calculate sentiment for a chunk of symbols with a single LLM call"""
+        try:
+            sections = []
+            for symbol, articles in symbol_to_articles.items():
+                article_texts = []
+                for article in articles[:self.BATCH_ARTICLES_PER_SYMBOL]:
+                    article_texts.append(f"Title: {article.get('title', '')}\nSummary: {article.get('summary', '')}")
+                sections.append(f"## {symbol}\n" + "\n\n".join(article_texts))
+            
+            system_prompt = """You are a financial news analyst. Analyze stock news articles for several stocks at once.
+
+Respond in JSON format with one key per symbol: {symbol: {polarity (-1 to 1), confidence (0 to 1), summary (brief), key_events (list)}}."""
+            
+            prompt = "For each symbol below return JSON {symbol: {polarity, confidence, summary, key_events}}. " \
+                     "Use the symbols exactly as written in the headings.\n\n" + "\n\n".join(sections)
+            
+            response = self.llm_service.analyze(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                temperature=0.3,
+                max_tokens=self.BATCH_TOKENS_PER_SYMBOL * len(symbol_to_articles)
+            )
+            
+            if not response:
+                return None
+            
+            parsed = _extract_json_object(response)
+            if parsed is None:
+                return None
+            
+            results = {}
+            for symbol, articles in symbol_to_articles.items():
+                result = parsed.get(symbol) or parsed.get(symbol.replace('.NS', ''))
+                if not isinstance(result, dict):
+                    continue
+                results[symbol] = {
+                    'polarity': float(result.get('polarity', 0.0)),
+                    'confidence': float(result.get('confidence', 0.5)),
+                    'summary': result.get('summary', 'LLM analysis completed'),
+                    'article_count': len(articles),
+                    'key_events': result.get('key_events', []),
+                    'llm_analyzed': True
+                }
+            return results
+        except Exception:
+            # Caller falls back to per-symbol analysis
+            return None
+    
     def _calculate_sentiment_keywords(self, articles: List[Dict]) -> Dict:
         """Calculate sentiment using keyword matching (fallback method)"""
         positive_count = 0
@@ -206,14 +393,13 @@ Provide sentiment analysis in JSON format."""
         for article in articles:
             text = (article.get('title', '') + ' ' + article.get('summary', '')).lower()
             
+            # Keyword hits are cached per article text (shared stories recur across symbols)
+            pos_matches, neg_matches, has_earnings = _article_keyword_hits(text)
+            
             # Check for earnings
-            if any(keyword in text for keyword in self.EARNINGS_KEYWORDS):
+            if has_earnings:
                 earnings_detected = True
             
-            # Count positive/negative keywords
-            pos_matches = sum(1 for keyword in self.POSITIVE_KEYWORDS if keyword in text)
-            neg_matches = sum(1 for keyword in self.NEGATIVE_KEYWORDS if keyword in text)
-            
             if pos_matches > neg_matches:
                 positive_count += 1
             elif neg_matches > pos_matches:
@@ -294,3 +480,46 @@ Provide sentiment analysis in JSON format."""
         sentiment = self.get_sentiment_for_symbol(symbol)
         return sentiment['polarity'] < negative_threshold and sentiment['confidence'] > 0.5
 
+
+def _build_keyword_automaton():
+    """Aho-Corasick automaton over all sentiment keywords (None if pyahocorasick is not installed)"""
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    
+    categories = {}
+    for category, keywords in (('pos', NewsFetcher.POSITIVE_KEYWORDS),
+                               ('neg', NewsFetcher.NEGATIVE_KEYWORDS),
+                               ('earn', NewsFetcher.EARNINGS_KEYWORDS)):
+        for keyword in keywords:
+            categories.setdefault(keyword, set()).add(category)
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, keyword_categories in categories.items():
+        automaton.add_word(keyword, (keyword, frozenset(keyword_categories)))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+@lru_cache(maxsize=8192)
+def _article_keyword_hits(text: str) -> Tuple[int, int, bool]:
+    """Positive/negative keyword counts and earnings flag for one lower-cased article text"""
+    if _KEYWORD_AUTOMATON is None:
+        pos_matches = sum(1 for keyword in NewsFetcher.POSITIVE_KEYWORDS if keyword in text)
+        neg_matches = sum(1 for keyword in NewsFetcher.NEGATIVE_KEYWORDS if keyword in text)
+        has_earnings = any(keyword in text for keyword in NewsFetcher.EARNINGS_KEYWORDS)
+        return pos_matches, neg_matches, has_earnings
+    
+    # Single pass over the text; each distinct keyword counts once (same as substring checks)
+    found = {}
+    for _, (keyword, keyword_categories) in _KEYWORD_AUTOMATON.iter(text):
+        found[keyword] = keyword_categories
+    
+    pos_matches = sum(1 for c in found.values() if 'pos' in c)
+    neg_matches = sum(1 for c in found.values() if 'neg' in c)
+    has_earnings = any('earn' in c for c in found.values())
+    return pos_matches, neg_matches, has_earnings
@@ -28,9 +28,7 @@ class RiskManager:
         today_str = today.isoformat()
         
         # Get all picks from today
-        conn = self.ledger.db_path
-        import sqlite3
-        db = sqlite3.connect(conn)
+        db = self.ledger.connect()
         cursor = db.cursor()
         
         cursor.execute("""
@@ -2,8 +2,11 @@
 AI-Powered Stock Discovery Tool - Scanner Engine
 """
 
-from typing import List, Dict, Optional
+import logging
+from typing import List, Dict, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import pandas as pd
 
 from .config import Config
 from .database import PickLedger
@@ -23,6 +26,9 @@ from .strategies.earnings_strategy import EarningsEventDrift
 from .multi_timeframe import MultiTimeframeAnalyzer
 
 
+logger = logging.getLogger(__name__)
+
+
 class ScannerEngine:
     """Main scanner orchestrator with learning integration"""
     
@@ -40,7 +46,8 @@ class ScannerEngine:
                 model=config.LLM_MODEL,
                 enabled=config.LLM_ENABLED,
                 cache_enabled=config.LLM_CACHE_ENABLED,
-                cache_duration=config.LLM_CACHE_DURATION
+                cache_duration=config.LLM_CACHE_DURATION,
+                degraded_model=config.LLM_DEGRADED_MODEL
             )
         
         self.learning = LearningEngine(config, self.ledger, llm_service)
@@ -102,9 +109,30 @@ class ScannerEngine:
         candidates = []
         hvb_count = 0
         
-        for symbol in self.config.NIFTY_SYMBOLS:
-            pick = self._analyze_symbol(symbol, mode, index_trend, enable_hvb, enable_penny_stock)
+        symbols = self.config.NIFTY_SYMBOLS
+        
+        # Symbols are independent and analysis is dominated by network I/O, so
+        # analyze them concurrently; picks are post-processed in universe order
+        with ThreadPoolExecutor(max_workers=max(1, self.config.SCAN_WORKERS)) as executor:
+            # HVB rejects ~90% of symbols on volatility alone, so screen the whole
+            # universe in one vectorized pass and only run HVB analysis on survivors
+            daily_data = {}
+            hvb_candidates = None
+            if enable_hvb and self.config.HVB_ENABLED:
+                daily_frames = executor.map(
+                    lambda symbol: self.fetcher.get_stock_data(symbol, period="60d", interval="1d"), symbols
+                )
+                daily_data = dict(zip(symbols, daily_frames))
+                hvb_candidates = self.hvb.prescreen(daily_data)
             
+            picks = list(executor.map(
+                lambda symbol: self._analyze_symbol_safe(symbol, mode, index_trend, enable_hvb, enable_penny_stock,
+                                                         daily_df=daily_data.get(symbol),
+                                                         hvb_candidates=hvb_candidates),
+                symbols
+            ))
+        
+        for pick in picks:
             if pick:
                 # Apply learning adjustments
                 if self.learning.should_learn():
@@ -143,10 +171,20 @@ class ScannerEngine:
         
         return top_picks
     
-    def _analyze_symbol(self, symbol: str, mode: str, regime: str, enable_hvb: bool, enable_penny_stock: bool = False) -> Optional[Dict]:
-        """Run all strategies on a symbol"""
+    def _analyze_symbol_safe(self, symbol: str, *args, **kwargs) -> Optional[Dict]:
+        """_analyze_symbol that logs and skips a failing symbol instead of aborting the scan"""
+        try:
+            return self._analyze_symbol(symbol, *args, **kwargs)
+        except Exception:
+            logger.debug("Analysis failed for %s", symbol, exc_info=True)
+            return None
+    
+    def _analyze_symbol(self, symbol: str, mode: str, regime: str, enable_hvb: bool, enable_penny_stock: bool = False,
+                        daily_df: Optional[pd.DataFrame] = None, hvb_candidates: Optional[Set[str]] = None) -> Optional[Dict]:
+        """Run all strategies on a symbol (daily_df/hvb_candidates may be supplied by a universe-wide prefetch)"""
         # Fetch data
-        daily_df = self.fetcher.get_stock_data(symbol, period="60d", interval="1d")
+        if daily_df is None:
+            daily_df = self.fetcher.get_stock_data(symbol, period="60d", interval="1d")
         
         # Price history filter: Require at least 60-90 days for penny stocks (3-6 months)
         # Normal stocks: at least 20 days (1 month)
@@ -265,6 +303,8 @@ class ScannerEngine:
             pass
         
         results = []
+        # Strategies may skip setups that can't reach the floor even after learning boosts
+        min_conviction = self.config.MIN_CONVICTION_SCORE
         
         # Intraday strategies
         if mode == "intraday":
@@ -275,24 +315,25 @@ class ScannerEngine:
                 if orb_signal:
                     results.append(orb_signal)
                 
-                vwap_signal = self.vwap.analyze(symbol, intraday_df, daily_df, sentiment_data)
+                vwap_signal = self.vwap.analyze(symbol, intraday_df, daily_df, sentiment_data,
+                                                min_conviction=min_conviction)
                 if vwap_signal:
                     results.append(vwap_signal)
         
         # Swing strategies (always evaluated)
-        momentum_signal = self.momentum.analyze(symbol, daily_df, sentiment_data)
+        momentum_signal = self.momentum.analyze(symbol, daily_df, sentiment_data, min_conviction=min_conviction)
         if momentum_signal:
             results.append(momentum_signal)
         
-        # Earnings/Event Drift strategy (only if earnings detected)
-        if sentiment_data and sentiment_data.get('earnings_detected', False):
+        # Earnings/Event Drift strategy (only for positive earnings events)
+        if self.earnings.is_applicable(sentiment_data):
             earnings_signal = self.earnings.analyze(symbol, daily_df, sentiment_data)
             if earnings_signal:
                 results.append(earnings_signal)
         
         # HVB (only if explicitly enabled)
-        if enable_hvb and self.config.HVB_ENABLED:
-            hvb_signal = self.hvb.analyze(symbol, daily_df, None, sentiment_data)
+        if enable_hvb and self.config.HVB_ENABLED and (hvb_candidates is None or symbol in hvb_candidates):
+            hvb_signal = self.hvb.analyze(symbol, daily_df, None, sentiment_data, min_conviction=min_conviction)
             if hvb_signal:
                 results.append(hvb_signal)
         
@@ -300,7 +341,8 @@ class ScannerEngine:
             return None
         
         # Take best strategy for this symbol
-        best = max(results, key=lambda x: x['conviction_score'])
+        # (as a plain dict: the pick is annotated and persisted from here on)
+        best = max(results, key=lambda x: x.conviction_score).to_dict()
         
         # Circuit breaker warning: Check if near circuit breaker
         near_circuit_breaker = self.market_context.is_near_circuit_breaker(symbol)
@@ -340,10 +382,9 @@ class ScannerEngine:
         
         # Debug logging for penny stock position sizing (helps tune stops)
         if enable_penny_stock and self.config.LLM_ENABLED:  # Only log if LLM enabled (debug mode indicator)
-            import logging
-            logging.debug(f"Penny stock position sizing for {symbol}: "
-                         f"risk_amount={risk_amount:.2f}, risk_per_share={risk_per_share:.2f}, "
-                         f"position_size={position_size:.0f}, stop_pct={abs(risk_per_share/best['entry_price']*100):.1f}%")
+            logger.debug("Penny stock position sizing for %s: risk_amount=%.2f, risk_per_share=%.2f, "
+                         "position_size=%.0f, stop_pct=%.1f%%", symbol, risk_amount, risk_per_share,
+                         position_size, abs(risk_per_share / best['entry_price'] * 100))
         
         # Mark as penny stock in features
         if enable_penny_stock:
@@ -399,7 +440,7 @@ class ScannerEngine:
                 if risk_assessment:
                     pick['llm_risk_assessment'] = risk_assessment
             except Exception as e:
-                print(f"⚠️  LLM risk assessment failed for {symbol}: {e}")
+                logger.debug("LLM risk assessment failed for %s: %s", symbol, e)
             
             try:
                 # Generate market context
@@ -407,7 +448,7 @@ class ScannerEngine:
                 if market_context:
                     pick['llm_market_context'] = market_context
             except Exception as e:
-                print(f"⚠️  LLM market context failed for {symbol}: {e}")
+                logger.debug("LLM market context failed for %s: %s", symbol, e)
             
             try:
                 # Generate news impact
@@ -417,7 +458,7 @@ class ScannerEngine:
                     if news_impact:
                         pick['llm_news_impact'] = news_impact
             except Exception as e:
-                print(f"⚠️  LLM news impact failed for {symbol}: {e}")
+                logger.debug("LLM news impact failed for %s: %s", symbol, e)
         
         return pick
     
@@ -5,13 +5,35 @@ Implements 7-dimension scoring system per PRD Section 7
 
 import numpy as np
 import pandas as pd
-from typing import Dict, Optional
+from typing import Dict, NamedTuple, Optional
 from .technical_indicators import TechnicalIndicators
 
 
+class CompositeScores(NamedTuple):
+    """Composite scores (unpack as `conviction, risk, dimensions = ...`)"""
+    conviction_score: float
+    risk_score: float
+    dimension_scores: Dict[str, float]
+
+
 class ScoringEngine:
     """Calculate all 7 scoring dimensions for stock picks"""
     
+    # Higher weight on trend, momentum, volume (core technicals)
+    # Lower weight on sentiment (may not always be available)
+    CONVICTION_WEIGHTS = {
+        'trend': 0.20,
+        'momentum': 0.20,
+        'volume': 0.15,
+        'volatility': 0.15,
+        'sentiment': 0.10,  # Lower weight (may be neutral if no news)
+        'liquidity': 0.10,
+        'risk': 0.10  # Inverted (lower risk = higher conviction)
+    }
+    
+    # Largest upward adjustment applied after scoring (learned strategy weight)
+    MAX_CONVICTION_BOOST = 20.0
+    
     @staticmethod
     def calculate_trend_score(daily_df: pd.DataFrame, current_price: float) -> float:
         """
@@ -150,6 +172,22 @@ class ScoringEngine:
         
         return max(0.0, min(100.0, base_score))
     
+    @staticmethod
+    def _volatility_percentile_adjustment(volatility_percentile: float) -> float:
+        """Volatility score adjustment for the percentile band"""
+        # Optimal volatility: 60-80th percentile (good opportunity, manageable risk)
+        if 60 <= volatility_percentile <= 80:
+            return 25.0  # Sweet spot
+        elif 50 <= volatility_percentile < 60:
+            return 15.0  # Good
+        elif 80 < volatility_percentile <= 90:
+            return 10.0  # High but acceptable
+        elif volatility_percentile > 90:
+            return -10.0  # Too volatile (risk)
+        elif volatility_percentile < 30:
+            return -15.0  # Too low (no opportunity)
+        return 0.0
+    
     @staticmethod
     def calculate_volatility_score(daily_df: pd.DataFrame, volatility_percentile: float = None) -> float:
         """
@@ -171,19 +209,7 @@ class ScoringEngine:
         atr_pct = (atr / current_price) * 100 if current_price > 0 else 0
         
         # Score calculation
-        # Optimal volatility: 60-80th percentile (good opportunity, manageable risk)
-        base_score = 50.0
-        
-        if 60 <= volatility_percentile <= 80:
-            base_score += 25  # Sweet spot
-        elif 50 <= volatility_percentile < 60:
-            base_score += 15  # Good
-        elif 80 < volatility_percentile <= 90:
-            base_score += 10  # High but acceptable
-        elif volatility_percentile > 90:
-            base_score -= 10  # Too volatile (risk)
-        elif volatility_percentile < 30:
-            base_score -= 15  # Too low (no opportunity)
+        base_score = 50.0 + ScoringEngine._volatility_percentile_adjustment(volatility_percentile)
         
         # ATR adjustment (normalize to 0-5% range)
         if 1.0 <= atr_pct <= 3.0:
@@ -332,15 +358,14 @@ class ScoringEngine:
                                   current_volume: float = None, volume_surge: bool = False,
                                   breakout_pct: float = 0.0, volatility_percentile: float = None,
                                   sentiment_data: Optional[Dict] = None,
-                                  min_avg_volume: int = 100000) -> Dict[str, float]:
+                                  min_avg_volume: int = 100000) -> CompositeScores:
         """
         Calculate all 7 dimension scores and composite conviction/risk scores
         
         Returns:
-            Dict with all scores:
-            - trend_score, momentum_score, volume_score, volatility_score
-            - sentiment_score, liquidity_score, risk_score
-            - conviction_score (composite), risk_score (composite)
+            CompositeScores(conviction_score, risk_score, dimension_scores) where
+            dimension_scores maps trend, momentum, volume, volatility, sentiment,
+            liquidity and risk to their 0-100 scores
         """
         # Calculate all 7 dimensions
         trend = ScoringEngine.calculate_trend_score(daily_df, entry_price)
@@ -352,17 +377,7 @@ class ScoringEngine:
         risk = ScoringEngine.calculate_risk_score(daily_df, entry_price, stop_loss, target_price, volatility_percentile)
         
         # Composite Conviction Score (weighted average)
-        # Higher weight on trend, momentum, volume (core technicals)
-        # Lower weight on sentiment (may not always be available)
-        weights = {
-            'trend': 0.20,
-            'momentum': 0.20,
-            'volume': 0.15,
-            'volatility': 0.15,
-            'sentiment': 0.10,  # Lower weight (may be neutral if no news)
-            'liquidity': 0.10,
-            'risk': 0.10  # Inverted (lower risk = higher conviction)
-        }
+        weights = ScoringEngine.CONVICTION_WEIGHTS
         
         # Risk score is inverted for conviction (lower risk = higher conviction)
         risk_inverted = 100.0 - risk
@@ -377,16 +392,10 @@ class ScoringEngine:
             risk_inverted * weights['risk']
         )
         
-        return {
-            'trend_score': trend,
-            'momentum_score': momentum,
-            'volume_score': volume,
-            'volatility_score': volatility,
-            'sentiment_score': sentiment,
-            'liquidity_score': liquidity,
-            'risk_score': risk,
-            'conviction_score': max(0.0, min(100.0, conviction)),
-            'dimension_scores': {
+        return CompositeScores(
+            conviction_score=max(0.0, min(100.0, conviction)),
+            risk_score=risk,
+            dimension_scores={
                 'trend': trend,
                 'momentum': momentum,
                 'volume': volume,
@@ -395,5 +404,52 @@ class ScoringEngine:
                 'liquidity': liquidity,
                 'risk': risk
             }
-        }
-
+        )
+    
+    @staticmethod
+    def conviction_upper_bound(daily_df: Optional[pd.DataFrame], entry_price: float,
+                               volatility_percentile: float = None,
+                               sentiment_data: Optional[Dict] = None,
+                               min_avg_volume: int = 100000) -> float:
+        """
+        Cheap upper bound on calculate_composite_scores()'s conviction score
+        
+        Trend, sentiment and liquidity are scored exactly (O(1) given the data),
+        volatility is scored from its percentile band with the best ATR adjustment,
+        and momentum, volume and inverted risk (which need levels, RSI or volume
+        history) are assumed perfect.
+        """
+        weights = ScoringEngine.CONVICTION_WEIGHTS
+        
+        if daily_df is None or daily_df.empty:
+            volatility = 50.0
+        else:
+            if volatility_percentile is None:
+                volatility_percentile = TechnicalIndicators.calculate_volatility_percentile(daily_df)
+            volatility = min(100.0, 60.0 + ScoringEngine._volatility_percentile_adjustment(volatility_percentile))
+        
+        bound = (
+            ScoringEngine.calculate_trend_score(daily_df, entry_price) * weights['trend'] +
+            100.0 * weights['momentum'] +
+            100.0 * weights['volume'] +
+            volatility * weights['volatility'] +
+            ScoringEngine.calculate_sentiment_score(sentiment_data) * weights['sentiment'] +
+            ScoringEngine.calculate_liquidity_score(daily_df, min_avg_volume) * weights['liquidity'] +
+            100.0 * weights['risk']
+        )
+        return min(100.0, bound)
+    
+    @staticmethod
+    def can_reach_conviction(min_conviction: float, daily_df: Optional[pd.DataFrame], entry_price: float,
+                             volatility_percentile: float = None,
+                             sentiment_data: Optional[Dict] = None,
+                             min_avg_volume: int = 100000) -> bool:
+        """
+        Whether a pick could still end up at or above min_conviction
+        
+        False means full scoring (and the entry/stop/target math feeding it) can be
+        skipped: even the upper bound plus the largest later boost falls short.
+        """
+        bound = ScoringEngine.conviction_upper_bound(daily_df, entry_price, volatility_percentile,
+                                                     sentiment_data, min_avg_volume)
+        return bound + ScoringEngine.MAX_CONVICTION_BOOST >= min_conviction
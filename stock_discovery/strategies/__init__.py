@@ -1,3 +1,31 @@
 """
 Strategies package for stock discovery tool
+
+Strategy classes are resolved on first attribute access, so importing one
+submodule (e.g. _kernels) does not pull in every strategy.
 """
+
+import importlib
+
+_STRATEGY_MODULES = {
+    "OpeningRangeBreakout": "orb_strategy",
+    "VWAPPullback": "vwap_strategy",
+    "MomentumSwing": "momentum_strategy",
+    "HighVolatilityBreakout": "hvb_strategy",
+    "EarningsEventDrift": "earnings_strategy",
+}
+
+__all__ = list(_STRATEGY_MODULES)
+
+
+def __getattr__(name):
+    module_name = _STRATEGY_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,121 @@
+"""
+AI-Powered Stock Discovery Tool - Strategy decision kernels
+
+Scalar entry/stop/target arithmetic shared by the strategies, kept free of
+pandas so it can be JIT-compiled with Numba when it is installed. Without
+Numba the kernels run as plain Python with identical results.
+
+The *_signal gates use only elementwise operators, so they accept either
+scalars (one symbol) or equal-length arrays (one entry per symbol) and then
+return a boolean mask.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def orb_signal(orb_high, current_price, current_volume, avg_volume):
+    """ORB gate: (breakout_up, volume_surge)"""
+    volume_surge = current_volume > avg_volume * 1.2
+    return (current_price > orb_high) & volume_surge, volume_surge
+
+
+@njit(cache=True)
+def orb_levels(orb_high, orb_low, current_price, atr):
+    """ORB levels: (atr, stop_loss, target, breakout_pct); stop never below the ORB low"""
+    if atr == 0:
+        atr = orb_high - orb_low
+    
+    stop_loss = max(orb_high - atr * 1.5, orb_low)
+    target = orb_high + atr * 2.0
+    breakout_pct = ((current_price - orb_high) / orb_high) * 100
+    return atr, stop_loss, target, breakout_pct
+
+
+@njit(cache=True)
+def vwap_signal(current_price, vwap, uptrend):
+    """VWAP gate: (qualifies, distance_from_vwap)"""
+    distance_from_vwap = np.abs(current_price - vwap) / vwap
+    near_vwap = distance_from_vwap < 0.01
+    above_vwap = current_price > vwap * 0.998
+    return near_vwap & above_vwap & uptrend, distance_from_vwap
+
+
+@njit(cache=True)
+def vwap_levels(vwap, current_price, atr):
+    """VWAP levels: (atr, stop_loss, target)"""
+    if atr == 0:
+        atr = current_price * 0.02
+    return atr, vwap - atr * 1.0, current_price + atr * 2.5
+
+
+@njit(cache=True)
+def momentum_signal(ma_short, ma_long, rsi):
+    """Momentum gate: bullish MA cross with RSI in the 40-70 band"""
+    return (ma_short > ma_long) & (rsi > 40) & (rsi < 70)
+
+
+@njit(cache=True)
+def momentum_levels(current_price, ma_short, atr):
+    """Momentum levels: (atr, stop_loss, target)"""
+    if atr == 0:
+        atr = current_price * 0.02
+    return atr, ma_short - atr, current_price + atr * 3.0
+
+
+@njit(cache=True)
+def hvb_signal(vol_percentile, min_vol_percentile, current_high, high_20d,
+               recent_volume, avg_volume, min_avg_volume):
+    """HVB gate: top volatility, near 20-day high, volume surge and liquidity"""
+    return ((vol_percentile >= min_vol_percentile)
+            & (current_high >= high_20d * 0.98)
+            & (recent_volume > avg_volume * 1.5)
+            & (avg_volume >= min_avg_volume))
+
+
+@njit(cache=True)
+def hvb_levels(current_price, current_high, high_20d, atr):
+    """HVB levels: (atr, stop_loss, target, potential_move_pct, breakout_pct)"""
+    if atr == 0:
+        atr = current_price * 0.03
+    
+    stop_loss = current_price - atr * 2.5  # Wider stop
+    target = current_price + atr * 5.0  # Aggressive target
+    potential_move_pct = ((target - current_price) / current_price) * 100
+    breakout_pct = ((current_high - high_20d) / high_20d) * 100 if high_20d > 0 else 0.0
+    return atr, stop_loss, target, potential_move_pct, breakout_pct
+
+
+@njit(cache=True)
+def earnings_signal(first_close, current_price, recent_volume, avg_volume, ma_20):
+    """
+    Earnings drift gate: (qualifies, price_change_pct, volume_surge)
+    
+    Needs at least a 2% post-earnings move with price holding above the 20-day MA.
+    """
+    price_change = (current_price - first_close) / first_close * 100
+    volume_surge = recent_volume > avg_volume * 1.5
+    return (price_change >= 2.0) & (current_price >= ma_20), price_change, volume_surge
+
+
+@njit(cache=True)
+def earnings_levels(entry_price, recent_low, atr):
+    """Earnings drift levels: (stop_loss, target, risk_reward_ratio)"""
+    atr_stop = entry_price - atr * 1.5  # 1.5 ATR stop
+    stop_loss = max(recent_low * 0.98, atr_stop)  # 2% below recent low or ATR-based
+    
+    # Conservative target: 1.5:1 R:R or a 5% move, whichever is higher
+    risk_amount = entry_price - stop_loss
+    target_price = max(entry_price + risk_amount * 1.5, entry_price * 1.05)
+    
+    risk_reward = (target_price - entry_price) / risk_amount if risk_amount > 0 else 0.0
+    return stop_loss, target_price, risk_reward
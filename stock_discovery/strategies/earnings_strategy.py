@@ -10,6 +10,8 @@ from datetime import datetime, timedelta
 from ..technical_indicators import TechnicalIndicators
 from ..scoring_engine import ScoringEngine
 from ..config import Config
+from . import _kernels
+from .pick import StrategyPick
 
 
 class EarningsEventDrift:
@@ -27,7 +29,21 @@ class EarningsEventDrift:
     def __init__(self, config: Config):
         self.config = config
     
-    def analyze(self, symbol: str, daily_df: pd.DataFrame, sentiment_data: Optional[Dict] = None) -> Optional[Dict]:
+    @staticmethod
+    def is_applicable(sentiment_data: Optional[Dict]) -> bool:
+        """
+        Whether a symbol's news can produce an earnings drift setup at all
+        
+        Only detected earnings events with a positive surprise are traded, so
+        callers can skip analyze() (and any data work) when this is False.
+        """
+        return bool(
+            sentiment_data
+            and sentiment_data.get('earnings_detected', False)
+            and sentiment_data.get('polarity', 'neutral') == 'positive'
+        )
+    
+    def analyze(self, symbol: str, daily_df: pd.DataFrame, sentiment_data: Optional[Dict] = None) -> Optional[StrategyPick]:
         """
         Analyze symbol for earnings event drift opportunity
         
@@ -39,14 +55,18 @@ class EarningsEventDrift:
         Returns:
             Dict with pick details or None
         """
-        if daily_df is None or len(daily_df) < 20:
+        # Earnings event with positive surprise (checked before any DataFrame work)
+        if not self.is_applicable(sentiment_data):
             return None
         
-        # Check if earnings event detected
-        if not sentiment_data or not sentiment_data.get('earnings_detected', False):
+        daily_df = TechnicalIndicators.as_pandas(daily_df)
+        if not TechnicalIndicators.is_valid_ohlcv(daily_df, 20):
             return None
         
-        current_price = daily_df['close'].iloc[-1]
+        close = daily_df['close'].to_numpy()
+        low = daily_df['low'].to_numpy()
+        volume = daily_df['volume'].to_numpy()
+        current_price = close[-1]
         
         # Check for recent earnings (within last 5 days)
         # We'll use sentiment data to determine if earnings was recent
@@ -54,42 +74,28 @@ class EarningsEventDrift:
         
         # Analyze post-earnings price action
         # Look for continuation after earnings announcement
-        recent_data = daily_df.tail(10)  # Last 10 days
+        recent_close = close[-10:]  # Last 10 days
         
         # Calculate post-earnings momentum
-        if len(recent_data) < 5:
-            return None
-        
-        # Price movement in recent days (post-earnings)
-        price_change = (recent_data['close'].iloc[-1] - recent_data['close'].iloc[0]) / recent_data['close'].iloc[0] * 100
-        
-        # Volume surge (earnings usually have high volume)
-        avg_volume = daily_df['volume'].mean()
-        recent_volume = recent_data['volume'].mean()
-        volume_surge = recent_volume > avg_volume * 1.5
-        
-        # Earnings surprise detection (from sentiment)
-        # Positive sentiment suggests beat, negative suggests miss
-        sentiment_polarity = sentiment_data.get('polarity', 'neutral')
-        earnings_positive = sentiment_polarity == 'positive'
-        
-        # Only trade positive earnings surprises with continuation
-        if not earnings_positive:
-            return None
-        
-        # Post-earnings continuation check
-        # Price should be moving in direction of earnings surprise
-        if price_change < 2.0:  # Need at least 2% move post-earnings
+        if len(recent_close) < 5:
             return None
         
         # Technical confirmation
-        ma_20 = daily_df['close'].tail(20).mean()
-        ma_50 = daily_df['close'].tail(50).mean() if len(daily_df) >= 50 else ma_20
-        
-        # Price should be above MAs (uptrend)
-        if current_price < ma_20:
+        ma_20 = TechnicalIndicators.last_sma(close, 20)
+        ma_50 = TechnicalIndicators.last_sma(close, 50) if len(close) >= 50 else ma_20
+        
+        # Post-earnings continuation: price moving in the direction of the surprise
+        # (at least 2% over the last 10 days) and holding above the 20-day MA;
+        # volume surge (earnings usually have high volume) feeds the scoring
+        qualifies, price_change, volume_surge = _kernels.earnings_signal(
+            recent_close[0], current_price, volume[-10:].mean(), volume.mean(), ma_20
+        )
+        if not qualifies:
             return None
         
+        # Only positive earnings surprises reach this point (see is_applicable)
+        earnings_positive = True
+        
         # RSI check (not overbought)
         rsi = TechnicalIndicators.calculate_rsi(daily_df)
         if rsi is None or rsi > 75:  # Too overbought
@@ -104,16 +110,8 @@ class EarningsEventDrift:
         entry_price = current_price
         
         # Stop-loss: Below recent low or ATR-based (tighter than swing)
-        recent_low = recent_data['low'].min()
-        atr_stop = entry_price - (atr * 1.5)  # 1.5 ATR stop
-        stop_loss = max(recent_low * 0.98, atr_stop)  # 2% below recent low or ATR-based
-        
-        # Target: Based on earnings surprise magnitude and momentum
-        # Conservative target: 1.5x risk or 5% move, whichever is higher
-        risk_amount = entry_price - stop_loss
-        target_price = entry_price + (risk_amount * 1.5)  # 1.5:1 R:R minimum
-        # Or 5% move, whichever is higher
-        target_price = max(target_price, entry_price * 1.05)
+        # Target: 1.5:1 R:R or 5% move, whichever is higher
+        stop_loss, target_price, risk_reward = _kernels.earnings_levels(entry_price, low[-10:].min(), atr)
         
         # Calculate breakout percentage
         breakout_pct = price_change
@@ -125,13 +123,13 @@ class EarningsEventDrift:
         volatility_percentile = TechnicalIndicators.calculate_volatility_percentile(daily_df)
         
         # Calculate all 7 dimension scores
-        scores = ScoringEngine.calculate_composite_scores(
+        base_conviction, risk_score, dimension_scores = ScoringEngine.calculate_composite_scores(
             daily_df=daily_df,
             intraday_df=None,
             entry_price=entry_price,
             stop_loss=stop_loss,
             target_price=target_price,
-            current_volume=recent_data['volume'].iloc[-1],
+            current_volume=volume[-1],
             volume_surge=volume_surge_flag,
             breakout_pct=breakout_pct,
             volatility_percentile=volatility_percentile,
@@ -140,13 +138,9 @@ class EarningsEventDrift:
         )
         
         # Boost conviction for earnings surprise
-        base_conviction = scores['conviction_score']
         earnings_boost = 5.0 if earnings_positive else 0.0
         conviction_score = min(100.0, base_conviction + earnings_boost)
         
-        # Risk score
-        risk_score = scores['risk_score']
-        
         # Features
         features = {
             'earnings_detected': True,
@@ -159,7 +153,10 @@ class EarningsEventDrift:
             'above_ma20': current_price > ma_20,
             'above_ma50': current_price > ma_50,
             'volatility_percentile': volatility_percentile,
-            **{f'{k}_score': v for k, v in scores.items() if k.endswith('_score')}
+            # trend_score ... risk_score; ledger rows written before this
+            # used doubled keys such as trend_score_score
+            **{f'{k}_score': v for k, v in dimension_scores.items()},
+            'conviction_score': base_conviction
         }
         
         # Trade plan
@@ -167,19 +164,19 @@ class EarningsEventDrift:
             'entry': entry_price,
             'stop_loss': stop_loss,
             'target': target_price,
-            'risk_reward_ratio': (target_price - entry_price) / (entry_price - stop_loss) if (entry_price - stop_loss) > 0 else 0,
+            'risk_reward_ratio': risk_reward,
             'holding_period_days': 5  # Short-term post-earnings drift
         }
         
-        return {
-            'strategy': 'EARNINGS_DRIFT',
-            'symbol': symbol,
-            'entry_price': entry_price,
-            'stop_loss': stop_loss,
-            'target_price': target_price,
-            'conviction_score': conviction_score,
-            'risk_score': risk_score,
-            'features': features,
-            'trade_plan': trade_plan
-        }
+        return StrategyPick(
+            strategy='EARNINGS_DRIFT',
+            symbol=symbol,
+            entry_price=entry_price,
+            stop_loss=stop_loss,
+            target_price=target_price,
+            conviction_score=conviction_score,
+            risk_score=risk_score,
+            features=features,
+            trade_plan=trade_plan
+        )
 
@@ -3,13 +3,15 @@ AI-Powered Stock Discovery Tool - High Volatility Breakout Strategy
 ⚠️ HIGH RISK MODE - Opt-in only
 """
 
-from typing import Optional, Dict
+from typing import Optional, Dict, Set
 import pandas as pd
 import numpy as np
 
 from ..config import Config
 from ..technical_indicators import TechnicalIndicators
 from ..scoring_engine import ScoringEngine
+from . import _kernels
+from .pick import StrategyPick
 
 
 class HighVolatilityBreakout:
@@ -19,96 +21,128 @@ class HighVolatilityBreakout:
         self.config = config
     
     def analyze(self, symbol: str, daily_df: pd.DataFrame, intraday_df: Optional[pd.DataFrame] = None,
-                sentiment_data: Optional[Dict] = None) -> Optional[Dict]:
-        """Detect high-volatility breakout setup"""
-        if daily_df is None or daily_df.empty or len(daily_df) < 60:
+                sentiment_data: Optional[Dict] = None,
+                min_conviction: Optional[float] = None) -> Optional[StrategyPick]:
+        """
+        Detect high-volatility breakout setup
+        
+        With min_conviction set (the scanner's floor), setups that can't reach it
+        are dropped before levels and full scoring; None returns every setup.
+        """
+        daily_df = TechnicalIndicators.as_pandas(daily_df)
+        intraday_df = TechnicalIndicators.as_pandas(intraday_df)
+        if not TechnicalIndicators.is_valid_ohlcv(daily_df, 60):
             return None
         
-        try:
-            current_price = daily_df['close'].iloc[-1]
-            
-            # Calculate volatility percentile
-            vol_percentile = TechnicalIndicators.calculate_volatility_percentile(daily_df, lookback=60)
-            
-            # Only proceed if volatility is in top 10%
-            if vol_percentile < self.config.HVB_MIN_VOLATILITY_PERCENTILE:
-                return None
-            
-            # Check for breakout pattern
-            high_20d = daily_df['high'].iloc[-20:].max()
-            current_high = daily_df['high'].iloc[-1]
-            
-            # Must be breaking out to new highs
-            breaking_out = current_high >= high_20d * 0.98
-            
-            if not breaking_out:
-                return None
-            
-            # Volume confirmation
-            avg_volume = daily_df['volume'].mean()
-            recent_volume = daily_df['volume'].iloc[-3:].mean()
-            volume_surge = recent_volume > avg_volume * 1.5
-            
-            if not volume_surge:
-                return None
-            
-            # Liquidity check (must meet minimum)
-            if avg_volume < self.config.MIN_AVG_VOLUME:
-                return None
-            
-            # Calculate stops and targets (wider for HVB)
-            atr = TechnicalIndicators.calculate_atr(daily_df)
-            if atr == 0:
-                atr = current_price * 0.03
-            
-            stop_loss = current_price - (atr * 2.5)  # Wider stop
-            target = current_price + (atr * 5.0)  # Aggressive target
-            
-            # Calculate potential move
-            potential_move_pct = ((target - current_price) / current_price) * 100
-            
-            # Breakout percentage
-            breakout_pct = ((current_high - high_20d) / high_20d) * 100 if high_20d > 0 else 0
+        high = daily_df['high'].to_numpy()
+        volume = daily_df['volume'].to_numpy()
+        current_price = daily_df['close'].to_numpy()[-1]
+        
+        # Calculate volatility percentile
+        vol_percentile = TechnicalIndicators.calculate_volatility_percentile(daily_df, lookback=60)
+        
+        # Breakout pattern and volume confirmation
+        high_20d = high[-20:].max()
+        current_high = high[-1]
+        avg_volume = volume.mean()
+        recent_volume = volume[-3:].mean()
+        
+        # Top-decile volatility, breaking out to new highs on a volume surge, liquid
+        if not _kernels.hvb_signal(vol_percentile, self.config.HVB_MIN_VOLATILITY_PERCENTILE,
+                                   current_high, high_20d, recent_volume, avg_volume,
+                                   self.config.MIN_AVG_VOLUME):
+            return None
+        volume_surge = True
+        
+        # Skip levels and full scoring when the pick can't reach the conviction floor
+        if min_conviction is not None and not ScoringEngine.can_reach_conviction(
+                min_conviction, daily_df, current_price, vol_percentile, sentiment_data,
+                self.config.MIN_AVG_VOLUME):
+            return None
+        
+        # Calculate stops and targets (wider for HVB)
+        atr = TechnicalIndicators.calculate_atr(daily_df)
+        atr, stop_loss, target, potential_move_pct, breakout_pct = _kernels.hvb_levels(
+            current_price, current_high, high_20d, atr
+        )
+        
+        # Use comprehensive 7-dimension scoring
+        # Note: HVB will have high volatility score and high risk score
+        conviction_score, risk_score, dimension_scores = ScoringEngine.calculate_composite_scores(
+            daily_df=daily_df,
+            intraday_df=intraday_df,
+            entry_price=current_price,
+            stop_loss=stop_loss,
+            target_price=target,
+            current_volume=recent_volume,
+            volume_surge=volume_surge,
+            breakout_pct=breakout_pct,
+            volatility_percentile=vol_percentile,
+            sentiment_data=sentiment_data,
+            min_avg_volume=self.config.MIN_AVG_VOLUME
+        )
+        
+        # Override risk score for HVB (always high risk)
+        risk_score = max(85.0, risk_score)
+        
+        return StrategyPick(
+            strategy='HVB',
+            entry_price=float(current_price),
+            stop_loss=float(stop_loss),
+            target_price=float(target),
+            conviction_score=conviction_score,
+            risk_score=risk_score,
+            risk_label='⚠️ HIGH RISK',
+            features={
+                'volatility_percentile': float(vol_percentile),
+                'potential_move_pct': float(potential_move_pct),
+                'volume_surge': volume_surge,
+                'avg_volume': float(avg_volume),
+                'atr': float(atr),
+                'breakout_pct': float(breakout_pct),
+                'warning': 'High volatility - expect large swings both ways'
+            },
+            dimension_scores=dimension_scores
+        )
+
+    
+    def prescreen(self, daily_dfs: Dict[str, Optional[pd.DataFrame]]) -> Set[str]:
+        """
+        Screen the whole universe for HVB candidates in one vectorized pass
+        
+        Volatility, breakout, volume and liquidity gates are evaluated on stacked
+        (n_symbols, n_bars) arrays. Since roughly 90% of symbols fail the volatility
+        gate, callers should only run analyze() for the symbols returned here.
+        """
+        candidates = set()
+        
+        for symbols, panel in TechnicalIndicators.panels_by_length(daily_dfs, min_bars=60):
+            high = panel['high']
+            volume = panel['volume']
             
-            # Use comprehensive 7-dimension scoring
-            # Note: HVB will have high volatility score and high risk score
-            scores = ScoringEngine.calculate_composite_scores(
-                daily_df=daily_df,
-                intraday_df=intraday_df,
-                entry_price=current_price,
-                stop_loss=stop_loss,
-                target_price=target,
-                current_volume=recent_volume,
-                volume_surge=volume_surge,
-                breakout_pct=breakout_pct,
-                volatility_percentile=vol_percentile,
-                sentiment_data=sentiment_data,
-                min_avg_volume=self.config.MIN_AVG_VOLUME
+            passed = _kernels.hvb_signal(
+                TechnicalIndicators.volatility_percentile_panel(panel['close'], lookback=60),
+                self.config.HVB_MIN_VOLATILITY_PERCENTILE,
+                high[:, -1], high[:, -20:].max(axis=1),
+                volume[:, -3:].mean(axis=1), volume.mean(axis=1),
+                self.config.MIN_AVG_VOLUME
             )
-            
-            # Override risk score for HVB (always high risk)
-            scores['risk_score'] = max(85.0, scores['risk_score'])
-            
-            return {
-                'strategy': 'HVB',
-                'entry_price': float(current_price),
-                'stop_loss': float(stop_loss),
-                'target_price': float(target),
-                'conviction_score': scores['conviction_score'],
-                'risk_score': scores['risk_score'],
-                'risk_label': '⚠️ HIGH RISK',
-                'features': {
-                    'volatility_percentile': float(vol_percentile),
-                    'potential_move_pct': float(potential_move_pct),
-                    'volume_surge': volume_surge,
-                    'avg_volume': float(avg_volume),
-                    'atr': float(atr),
-                    'breakout_pct': float(breakout_pct),
-                    'warning': 'High volatility - expect large swings both ways'
-                },
-                'dimension_scores': scores['dimension_scores']
-            }
+            candidates.update(symbols[i] for i in np.flatnonzero(passed))
         
-        except Exception as e:
-            print(f"HVB analysis error for {symbol}: {e}")
-            return None
+        return candidates
+    
+    def batch_analyze(self, daily_dfs: Dict[str, pd.DataFrame],
+                      intraday_dfs: Optional[Dict[str, pd.DataFrame]] = None,
+                      sentiment_map: Optional[Dict[str, Dict]] = None) -> Dict[str, StrategyPick]:
+        """Detect high-volatility breakouts across many symbols (full analysis only for prescreened ones)"""
+        intraday_dfs = intraday_dfs or {}
+        sentiment_map = sentiment_map or {}
+        results = {}
+        
+        for symbol in self.prescreen(daily_dfs):
+            result = self.analyze(symbol, daily_dfs[symbol], intraday_dfs.get(symbol),
+                                  sentiment_map.get(symbol))
+            if result:
+                results[symbol] = result
+        
+        return results
@@ -9,6 +9,8 @@ import numpy as np
 from ..config import Config
 from ..technical_indicators import TechnicalIndicators
 from ..scoring_engine import ScoringEngine
+from . import _kernels
+from .pick import StrategyPick
 
 
 class MomentumSwing:
@@ -17,81 +19,84 @@ class MomentumSwing:
     def __init__(self, config: Config):
         self.config = config
     
-    def analyze(self, symbol: str, daily_df: pd.DataFrame, sentiment_data: Optional[Dict] = None) -> Optional[Dict]:
-        """Detect momentum swing setup"""
-        if daily_df is None or daily_df.empty or len(daily_df) < 50:
+    def analyze(self, symbol: str, daily_df: pd.DataFrame, sentiment_data: Optional[Dict] = None,
+                min_conviction: Optional[float] = None) -> Optional[StrategyPick]:
+        """
+        Detect momentum swing setup
+        
+        With min_conviction set (the scanner's floor), setups that can't reach it
+        are dropped before levels and full scoring; None returns every setup.
+        """
+        daily_df = TechnicalIndicators.as_pandas(daily_df)
+        if not TechnicalIndicators.is_valid_ohlcv(daily_df, 50):
+            return None
+        
+        close = daily_df['close'].to_numpy()
+        volume = daily_df['volume'].to_numpy()
+        current_price = close[-1]
+        
+        # Calculate MAs and RSI
+        mas = TechnicalIndicators.calculate_moving_averages(
+            daily_df, 
+            self.config.MOMENTUM_MA_SHORT, 
+            self.config.MOMENTUM_MA_LONG
+        )
+        rsi = TechnicalIndicators.calculate_rsi(daily_df)
+        
+        # Volume trend
+        recent_volume = volume[-5:].mean()
+        older_volume = volume[-20:-5].mean()
+        volume_trend = recent_volume > older_volume
+        
+        # Bullish MA cross with RSI in range
+        if not _kernels.momentum_signal(mas['ma_short'], mas['ma_long'], rsi):
             return None
         
-        try:
-            current_price = daily_df['close'].iloc[-1]
-            
-            # Calculate MAs and RSI
-            mas = TechnicalIndicators.calculate_moving_averages(
-                daily_df, 
-                self.config.MOMENTUM_MA_SHORT, 
-                self.config.MOMENTUM_MA_LONG
-            )
-            rsi = TechnicalIndicators.calculate_rsi(daily_df)
-            atr = TechnicalIndicators.calculate_atr(daily_df)
-            
-            # Check conditions
-            ma_bullish = mas['ma_cross']
-            rsi_acceptable = 40 < rsi < 70
-            
-            # Volume trend
-            recent_volume = daily_df['volume'].iloc[-5:].mean()
-            older_volume = daily_df['volume'].iloc[-20:-5].mean()
-            volume_trend = recent_volume > older_volume
-            
-            if not (ma_bullish and rsi_acceptable):
-                return None
-            
-            # Stops and targets
-            if atr == 0:
-                atr = current_price * 0.02
-            
-            stop_loss = mas['ma_short'] - atr
-            target = current_price + (atr * 3.0)
-            
-            # Calculate volatility percentile
-            volatility_percentile = TechnicalIndicators.calculate_volatility_percentile(daily_df)
-            
-            # Current volume
-            current_volume = recent_volume
-            
-            # Use comprehensive 7-dimension scoring
-            scores = ScoringEngine.calculate_composite_scores(
-                daily_df=daily_df,
-                intraday_df=None,  # Swing strategy uses daily data
-                entry_price=current_price,
-                stop_loss=stop_loss,
-                target_price=target,
-                current_volume=current_volume,
-                volume_surge=volume_trend,
-                breakout_pct=0.0,  # Not a breakout pattern
-                volatility_percentile=volatility_percentile,
-                sentiment_data=sentiment_data,
-                min_avg_volume=self.config.MIN_AVG_VOLUME
-            )
-            
-            return {
-                'strategy': 'MOMENTUM_SWING',
-                'entry_price': float(current_price),
-                'stop_loss': float(stop_loss),
-                'target_price': float(target),
-                'conviction_score': scores['conviction_score'],
-                'risk_score': scores['risk_score'],
-                'features': {
-                    'rsi': float(rsi),
-                    'ma_short': float(mas['ma_short']),
-                    'ma_long': float(mas['ma_long']),
-                    'volume_trend_up': volume_trend,
-                    'atr': float(atr),
-                    'volatility_percentile': float(volatility_percentile)
-                },
-                'dimension_scores': scores['dimension_scores']
-            }
+        # Calculate volatility percentile
+        volatility_percentile = TechnicalIndicators.calculate_volatility_percentile(daily_df)
         
-        except Exception as e:
-            print(f"Momentum analysis error for {symbol}: {e}")
+        # Skip levels and full scoring when the pick can't reach the conviction floor
+        if min_conviction is not None and not ScoringEngine.can_reach_conviction(
+                min_conviction, daily_df, current_price, volatility_percentile, sentiment_data,
+                self.config.MIN_AVG_VOLUME):
             return None
+        
+        # Stops and targets
+        atr = TechnicalIndicators.calculate_atr(daily_df)
+        atr, stop_loss, target = _kernels.momentum_levels(current_price, mas['ma_short'], atr)
+        
+        # Current volume
+        current_volume = recent_volume
+        
+        # Use comprehensive 7-dimension scoring
+        conviction_score, risk_score, dimension_scores = ScoringEngine.calculate_composite_scores(
+            daily_df=daily_df,
+            intraday_df=None,  # Swing strategy uses daily data
+            entry_price=current_price,
+            stop_loss=stop_loss,
+            target_price=target,
+            current_volume=current_volume,
+            volume_surge=volume_trend,
+            breakout_pct=0.0,  # Not a breakout pattern
+            volatility_percentile=volatility_percentile,
+            sentiment_data=sentiment_data,
+            min_avg_volume=self.config.MIN_AVG_VOLUME
+        )
+        
+        return StrategyPick(
+            strategy='MOMENTUM_SWING',
+            entry_price=float(current_price),
+            stop_loss=float(stop_loss),
+            target_price=float(target),
+            conviction_score=conviction_score,
+            risk_score=risk_score,
+            features={
+                'rsi': float(rsi),
+                'ma_short': float(mas['ma_short']),
+                'ma_long': float(mas['ma_long']),
+                'volume_trend_up': volume_trend,
+                'atr': float(atr),
+                'volatility_percentile': float(volatility_percentile)
+            },
+            dimension_scores=dimension_scores
+        )
@@ -2,7 +2,7 @@
 AI-Powered Stock Discovery Tool - Opening Range Breakout Strategy
 """
 
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -10,6 +10,8 @@ from datetime import datetime, timedelta
 from ..config import Config
 from ..technical_indicators import TechnicalIndicators
 from ..scoring_engine import ScoringEngine
+from . import _kernels
+from .pick import StrategyPick
 
 
 class OpeningRangeBreakout:
@@ -18,101 +20,109 @@ class OpeningRangeBreakout:
     def __init__(self, config: Config):
         self.config = config
     
+    def _opening_range(self, intraday_df: pd.DataFrame, daily_df: Optional[pd.DataFrame]) -> Optional[Tuple]:
+        """
+        Extract today's opening range inputs
+        
+        Returns:
+            (intraday_df, orb_high, orb_low, current_price, current_volume, avg_volume),
+            or None if there is no usable session today
+        """
+        intraday_df = TechnicalIndicators.as_pandas(intraday_df)
+        if not TechnicalIndicators.is_valid_ohlcv(intraday_df, 15) or 'datetime' not in intraday_df.columns:
+            return None
+        
+        # MarketDataFetcher already delivers datetime64; only parse other inputs,
+        # and never mutate the caller's frame
+        if not pd.api.types.is_datetime64_any_dtype(intraday_df['datetime']):
+            try:
+                intraday_df = intraday_df.assign(datetime=pd.to_datetime(intraday_df['datetime']))
+            except (ValueError, TypeError):
+                return None
+        
+        # MarketDataFetcher guarantees time order; the O(n) check keeps other inputs correct
+        datetimes = intraday_df['datetime']
+        if not datetimes.is_monotonic_increasing:
+            intraday_df = intraday_df.sort_values('datetime', ignore_index=True)
+            datetimes = intraday_df['datetime']
+        
+        # Today's bars: binary search for midnight of the latest session
+        day_start = datetimes.iloc[-1].normalize()
+        today_data = intraday_df.iloc[datetimes.searchsorted(day_start):]
+        
+        if len(today_data) < 15:
+            return None
+        
+        high = today_data['high'].to_numpy()
+        low = today_data['low'].to_numpy()
+        
+        # Get opening range (first 15 minutes)
+        orb_high = high[:self.config.ORB_PERIOD_MINUTES].max()
+        orb_low = low[:self.config.ORB_PERIOD_MINUTES].min()
+        
+        # Current price
+        current_price = today_data['close'].to_numpy()[-1]
+        
+        # Volume analysis
+        current_volume = today_data['volume'].to_numpy()[-10:].mean()
+        avg_volume = daily_df['volume'].to_numpy().mean() if TechnicalIndicators.is_valid_ohlcv(daily_df) else current_volume
+        
+        return intraday_df, orb_high, orb_low, current_price, current_volume, avg_volume
+    
     def analyze(self, symbol: str, intraday_df: pd.DataFrame, daily_df: pd.DataFrame, 
-                sentiment_data: Optional[Dict] = None) -> Optional[Dict]:
+                sentiment_data: Optional[Dict] = None) -> Optional[StrategyPick]:
         """Detect ORB setup"""
-        if intraday_df is None or intraday_df.empty or len(intraday_df) < 15:
+        daily_df = TechnicalIndicators.as_pandas(daily_df)
+        if not TechnicalIndicators.is_valid_ohlcv(daily_df):
+            daily_df = None
+        
+        session = self._opening_range(intraday_df, daily_df)
+        if session is None:
             return None
+        intraday_df, orb_high, orb_low, current_price, current_volume, avg_volume = session
         
-        try:
-            # Get today's data
-            if 'datetime' not in intraday_df.columns:
-                return None
-            
-            # Ensure datetime column is proper datetime type
-            intraday_df['datetime'] = pd.to_datetime(intraday_df['datetime'])
-            
-            # Get today's date (timezone naive)
-            latest_dt = intraday_df['datetime'].max()
-            today = latest_dt.date()
-            
-            # Filter to today's data
-            today_data = intraday_df[intraday_df['datetime'].dt.date == today].copy()
-            
-            if len(today_data) < 15:
-                return None
-            
-            # Sort by time
-            today_data = today_data.sort_values('datetime')
-            
-            # Get opening range (first 15 minutes)
-            opening_range = today_data.head(self.config.ORB_PERIOD_MINUTES)
-            orb_high = opening_range['high'].max()
-            orb_low = opening_range['low'].min()
-            
-            # Current price
-            current_price = today_data['close'].iloc[-1]
-            
-            # Volume analysis
-            current_volume = today_data['volume'].iloc[-10:].mean()
-            avg_volume = daily_df['volume'].mean() if daily_df is not None and not daily_df.empty else current_volume
-            
-            volume_surge = current_volume > avg_volume * 1.2
-            
-            # Check for breakout above ORB high
-            breakout_up = current_price > orb_high and volume_surge
-            
-            if not breakout_up:
-                return None
-            
-            # Calculate stops and targets
-            atr = TechnicalIndicators.calculate_atr(daily_df) if daily_df is not None else (orb_high - orb_low)
-            
-            if atr == 0:
-                atr = (orb_high - orb_low)
-            
-            stop_loss = orb_high - (atr * 1.5)
-            target = orb_high + (atr * 2.0)
-            
-            # Breakout strength
-            breakout_pct = ((current_price - orb_high) / orb_high) * 100
-            
-            # Calculate volatility percentile
-            volatility_percentile = TechnicalIndicators.calculate_volatility_percentile(daily_df) if daily_df is not None else 50.0
-            
-            # Use comprehensive 7-dimension scoring
-            scores = ScoringEngine.calculate_composite_scores(
-                daily_df=daily_df,
-                intraday_df=intraday_df,
-                entry_price=current_price,
-                stop_loss=max(stop_loss, orb_low),
-                target_price=target,
-                current_volume=current_volume,
-                volume_surge=volume_surge,
-                breakout_pct=breakout_pct,
-                volatility_percentile=volatility_percentile,
-                sentiment_data=sentiment_data,
-                min_avg_volume=self.config.MIN_AVG_VOLUME
-            )
-            
-            return {
-                'strategy': 'ORB',
-                'entry_price': float(current_price),
-                'stop_loss': float(max(stop_loss, orb_low)),  # Stop not below ORB low
-                'target_price': float(target),
-                'conviction_score': scores['conviction_score'],
-                'risk_score': scores['risk_score'],
-                'features': {
-                    'orb_high': float(orb_high),
-                    'orb_low': float(orb_low),
-                    'volume_surge': volume_surge,
-                    'atr': float(atr),
-                    'breakout_pct': float(breakout_pct),
-                    'volatility_percentile': float(volatility_percentile)
-                },
-                'dimension_scores': scores['dimension_scores']
-            }
-        
-        except Exception as e:
-            print(f"ORB analysis error for {symbol}: {e}")
+        # Check for breakout above ORB high
+        breakout_up, volume_surge = _kernels.orb_signal(orb_high, current_price, current_volume, avg_volume)
+        
+        if not breakout_up:
             return None
+        
+        # Calculate stops and targets (stop not below ORB low)
+        atr = TechnicalIndicators.calculate_atr(daily_df) if daily_df is not None else (orb_high - orb_low)
+        atr, stop_loss, target, breakout_pct = _kernels.orb_levels(orb_high, orb_low, current_price, atr)
+        
+        # Calculate volatility percentile
+        volatility_percentile = TechnicalIndicators.calculate_volatility_percentile(daily_df) if daily_df is not None else 50.0
+        
+        # Use comprehensive 7-dimension scoring
+        conviction_score, risk_score, dimension_scores = ScoringEngine.calculate_composite_scores(
+            daily_df=daily_df,
+            intraday_df=intraday_df,
+            entry_price=current_price,
+            stop_loss=stop_loss,
+            target_price=target,
+            current_volume=current_volume,
+            volume_surge=volume_surge,
+            breakout_pct=breakout_pct,
+            volatility_percentile=volatility_percentile,
+            sentiment_data=sentiment_data,
+            min_avg_volume=self.config.MIN_AVG_VOLUME
+        )
+        
+        return StrategyPick(
+            strategy='ORB',
+            entry_price=float(current_price),
+            stop_loss=float(stop_loss),
+            target_price=float(target),
+            conviction_score=conviction_score,
+            risk_score=risk_score,
+            features={
+                'orb_high': float(orb_high),
+                'orb_low': float(orb_low),
+                'volume_surge': volume_surge,
+                'atr': float(atr),
+                'breakout_pct': float(breakout_pct),
+                'volatility_percentile': float(volatility_percentile)
+            },
+            dimension_scores=dimension_scores
+        )
@@ -0,0 +1,53 @@
+"""
+AI-Powered Stock Discovery Tool - Strategy pick
+"""
+
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Optional
+
+
+@dataclass(slots=True, frozen=True)
+class StrategyPick:
+    """
+    Setup detected by a strategy's analyze()
+    
+    Supports read-only dict-style access (pick['entry_price'], pick.get(...),
+    'features' in pick) so signal consumers such as backtesting work unchanged.
+    Call to_dict() where a pick is annotated, stored or serialized.
+    Optional fields left as None are treated as absent keys.
+    """
+    strategy: str
+    entry_price: float
+    stop_loss: float
+    target_price: float
+    conviction_score: float
+    risk_score: float
+    features: Dict[str, Any] = field(default_factory=dict)
+    dimension_scores: Optional[Dict[str, float]] = None
+    risk_label: Optional[str] = None
+    symbol: Optional[str] = None
+    trade_plan: Optional[Dict[str, Any]] = None
+    
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+    
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        value = getattr(self, key) if key in self.__slots__ else None
+        return default if value is None else value
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict with the same keys strategies used to return"""
+        result = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if value is not None:
+                result[f.name] = value
+        # Features are enriched downstream; don't share the dict with this pick
+        result['features'] = dict(self.features)
+        return result
@@ -9,6 +9,76 @@ import numpy as np
 from ..config import Config
 from ..technical_indicators import TechnicalIndicators
 from ..scoring_engine import ScoringEngine
+from . import _kernels
+from .pick import StrategyPick
+
+
+class VWAPAccumulator:
+    """
+    Running VWAP for one symbol's intraday frame
+    
+    Repeated scans usually see the same frame with a few bars appended, so only
+    the new bars are folded into the running sums. The last bar is still in
+    progress (Yahoo revises its volume and close between scans), so the sums
+    hold completed bars only and the current last bar is added on each call.
+    Any other change (bars dropped from the front, history rewritten, no
+    datetime column to check) falls back to a full pass, matching
+    TechnicalIndicators.calculate_vwap.
+    """
+    
+    __slots__ = ('cum_pv', 'cum_v', 'n_bars', 'first_ts', 'last_ts')
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        # Sums over the first n_bars - 1 bars; bar n_bars - 1 was in progress last time
+        self.cum_pv = 0.0
+        self.cum_v = 0.0
+        self.n_bars = 0
+        self.first_ts = None
+        self.last_ts = None
+    
+    def _is_extension(self, datetimes: Optional[pd.Series]) -> bool:
+        """True if the frame is the previously seen frame plus appended bars"""
+        return (
+            datetimes is not None
+            and 0 < self.n_bars <= len(datetimes)
+            and datetimes.iloc[0] == self.first_ts
+            and datetimes.iloc[self.n_bars - 1] == self.last_ts
+        )
+    
+    @staticmethod
+    def _sums(bars: pd.DataFrame):
+        """(sum of typical price * volume, sum of volume) over bars"""
+        volume = bars['volume'].to_numpy(dtype=np.float64)
+        typical_price = (bars['high'].to_numpy() + bars['low'].to_numpy() + bars['close'].to_numpy()) / 3
+        return float(np.dot(typical_price, volume)), float(volume.sum())
+    
+    def update(self, intraday_df: pd.DataFrame) -> float:
+        """Fold newly completed bars into the running sums and return the current VWAP"""
+        datetimes = intraday_df['datetime'] if 'datetime' in intraday_df.columns else None
+        
+        if not self._is_extension(datetimes):
+            self.reset()
+        
+        n_bars = len(intraday_df)
+        if n_bars == 0:
+            return 0.0
+        
+        # The previous in-progress bar is folded in now, with its final values
+        pv, v = self._sums(intraday_df.iloc[max(self.n_bars - 1, 0):n_bars - 1])
+        self.cum_pv += pv
+        self.cum_v += v
+        
+        self.n_bars = n_bars
+        if datetimes is not None:
+            self.first_ts = datetimes.iloc[0]
+            self.last_ts = datetimes.iloc[-1]
+        
+        last_pv, last_v = self._sums(intraday_df.iloc[-1:])
+        total_v = self.cum_v + last_v
+        return (self.cum_pv + last_pv) / total_v if total_v else 0.0
 
 
 class VWAPPullback:
@@ -16,85 +86,102 @@ class VWAPPullback:
     
     def __init__(self, config: Config):
         self.config = config
+        self._vwap_accumulators: Dict[str, VWAPAccumulator] = {}
+    
+    def _session_vwap(self, symbol: str, intraday_df: pd.DataFrame) -> float:
+        """VWAP for a symbol, updated incrementally across repeated scans"""
+        accumulator = self._vwap_accumulators.get(symbol)
+        if accumulator is None:
+            accumulator = self._vwap_accumulators[symbol] = VWAPAccumulator()
+        return accumulator.update(intraday_df)
+    
+    @staticmethod
+    def _daily_uptrend(daily_df: Optional[pd.DataFrame]) -> bool:
+        """Daily MA trend filter (assumed up when there is not enough daily history)"""
+        if TechnicalIndicators.is_valid_ohlcv(daily_df, 20):
+            return bool(TechnicalIndicators.calculate_moving_averages(daily_df, 20, 50)['ma_cross'])
+        return True
     
     def analyze(self, symbol: str, intraday_df: pd.DataFrame, daily_df: pd.DataFrame,
-                sentiment_data: Optional[Dict] = None) -> Optional[Dict]:
-        """Detect VWAP pullback setup"""
-        if intraday_df is None or intraday_df.empty or len(intraday_df) < 50:
+                sentiment_data: Optional[Dict] = None,
+                min_conviction: Optional[float] = None) -> Optional[StrategyPick]:
+        """
+        Detect VWAP pullback setup
+        
+        With min_conviction set (the scanner's floor), setups that can't reach it
+        are dropped before levels and full scoring; None returns every setup.
+        """
+        intraday_df = TechnicalIndicators.as_pandas(intraday_df)
+        daily_df = TechnicalIndicators.as_pandas(daily_df)
+        if not TechnicalIndicators.is_valid_ohlcv(intraday_df, 50):
+            return None
+        
+        if not TechnicalIndicators.is_valid_ohlcv(daily_df):
+            daily_df = None
+        
+        # Calculate VWAP
+        vwap = self._session_vwap(symbol, intraday_df)
+        
+        if vwap == 0:
             return None
         
-        try:
-            # Calculate VWAP
-            vwap = TechnicalIndicators.calculate_vwap(intraday_df)
-            
-            if vwap == 0:
-                return None
-            
-            current_price = intraday_df['close'].iloc[-1]
-            
-            # Check if price near VWAP (within 1%)
-            distance_from_vwap = abs(current_price - vwap) / vwap
-            near_vwap = distance_from_vwap < 0.01
-            above_vwap = current_price > vwap * 0.998
-            
-            # Check daily trend
-            uptrend = True
-            if daily_df is not None and not daily_df.empty and len(daily_df) >= 20:
-                mas = TechnicalIndicators.calculate_moving_averages(daily_df, 20, 50)
-                uptrend = mas['ma_cross']
-            
-            if not (near_vwap and above_vwap and uptrend):
-                return None
-            
-            # Calculate stops and targets
-            atr = TechnicalIndicators.calculate_atr(daily_df) if daily_df is not None else current_price * 0.02
-            
-            if atr == 0:
-                atr = current_price * 0.02
-            
-            stop_loss = vwap - (atr * 1.0)
-            target = current_price + (atr * 2.5)
-            
-            # Calculate volatility percentile
-            volatility_percentile = TechnicalIndicators.calculate_volatility_percentile(daily_df) if daily_df is not None else 50.0
-            
-            # Volume analysis
-            current_volume = intraday_df['volume'].iloc[-10:].mean() if len(intraday_df) >= 10 else intraday_df['volume'].iloc[-1]
-            avg_volume = daily_df['volume'].mean() if daily_df is not None and not daily_df.empty else current_volume
-            volume_surge = current_volume > avg_volume * 1.1
-            
-            # Use comprehensive 7-dimension scoring
-            scores = ScoringEngine.calculate_composite_scores(
-                daily_df=daily_df,
-                intraday_df=intraday_df,
-                entry_price=current_price,
-                stop_loss=stop_loss,
-                target_price=target,
-                current_volume=current_volume,
-                volume_surge=volume_surge,
-                breakout_pct=0.0,  # Not a breakout, pullback
-                volatility_percentile=volatility_percentile,
-                sentiment_data=sentiment_data,
-                min_avg_volume=self.config.MIN_AVG_VOLUME
-            )
-            
-            return {
-                'strategy': 'VWAP_PULLBACK',
-                'entry_price': float(current_price),
-                'stop_loss': float(stop_loss),
-                'target_price': float(target),
-                'conviction_score': scores['conviction_score'],
-                'risk_score': scores['risk_score'],
-                'features': {
-                    'vwap': float(vwap),
-                    'distance_from_vwap_pct': float(distance_from_vwap * 100),
-                    'uptrend': uptrend,
-                    'atr': float(atr),
-                    'volatility_percentile': float(volatility_percentile)
-                },
-                'dimension_scores': scores['dimension_scores']
-            }
-        
-        except Exception as e:
-            print(f"VWAP analysis error for {symbol}: {e}")
+        intraday_volume = intraday_df['volume'].to_numpy()
+        current_price = intraday_df['close'].to_numpy()[-1]
+        
+        # Check daily trend
+        uptrend = self._daily_uptrend(daily_df)
+        
+        # Price near VWAP (within 1%), holding above it, in a daily uptrend
+        qualifies, distance_from_vwap = _kernels.vwap_signal(current_price, vwap, uptrend)
+        if not qualifies:
             return None
+        
+        # Calculate volatility percentile
+        volatility_percentile = TechnicalIndicators.calculate_volatility_percentile(daily_df) if daily_df is not None else 50.0
+        
+        # Skip levels and full scoring when the pick can't reach the conviction floor
+        if min_conviction is not None and not ScoringEngine.can_reach_conviction(
+                min_conviction, daily_df, current_price, volatility_percentile, sentiment_data,
+                self.config.MIN_AVG_VOLUME):
+            return None
+        
+        # Calculate stops and targets
+        atr = TechnicalIndicators.calculate_atr(daily_df) if daily_df is not None else current_price * 0.02
+        atr, stop_loss, target = _kernels.vwap_levels(vwap, current_price, atr)
+        
+        # Volume analysis
+        current_volume = intraday_volume[-10:].mean() if len(intraday_volume) >= 10 else intraday_volume[-1]
+        avg_volume = daily_df['volume'].to_numpy().mean() if daily_df is not None else current_volume
+        volume_surge = current_volume > avg_volume * 1.1
+        
+        # Use comprehensive 7-dimension scoring
+        conviction_score, risk_score, dimension_scores = ScoringEngine.calculate_composite_scores(
+            daily_df=daily_df,
+            intraday_df=intraday_df,
+            entry_price=current_price,
+            stop_loss=stop_loss,
+            target_price=target,
+            current_volume=current_volume,
+            volume_surge=volume_surge,
+            breakout_pct=0.0,  # Not a breakout, pullback
+            volatility_percentile=volatility_percentile,
+            sentiment_data=sentiment_data,
+            min_avg_volume=self.config.MIN_AVG_VOLUME
+        )
+        
+        return StrategyPick(
+            strategy='VWAP_PULLBACK',
+            entry_price=float(current_price),
+            stop_loss=float(stop_loss),
+            target_price=float(target),
+            conviction_score=conviction_score,
+            risk_score=risk_score,
+            features={
+                'vwap': float(vwap),
+                'distance_from_vwap_pct': float(distance_from_vwap * 100),
+                'uptrend': uptrend,
+                'atr': float(atr),
+                'volatility_percentile': float(volatility_percentile)
+            },
+            dimension_scores=dimension_scores
+        )
@@ -6,19 +6,137 @@ Supports: Yahoo Finance, NSE India website, manual CSV
 import yfinance as yf
 import pandas as pd
 import json
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
-import pickle
 import os
+import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 import requests
+import threading
 import time
+from urllib.parse import quote
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson as _json  # C-accelerated JSON parsing
+except ImportError:
+    import json as _json
+
+
+def _with_ns_suffix(symbols) -> tuple:
+    """Yahoo Finance tickers for NSE symbols"""
+    return tuple(f"{symbol}.NS" for symbol in symbols)
+
+
+def _unique_symbols(*groups) -> tuple:
+    """Concatenate symbol groups, dropping repeats (first occurrence wins) and interning"""
+    return tuple(dict.fromkeys(sys.intern(symbol) for group in groups for symbol in group))
+
+
+# Hardcoded index constituents (fallback when the NSE API is unavailable),
+# built once with the .NS suffix already applied
+
+# NIFTY 50 symbols (most liquid)
+_NIFTY50_NS = _with_ns_suffix((
+    "ADANIENT", "ADANIPORTS", "APOLLOHOSP", "ASIANPAINT", "AXISBANK",
+    "BAJAJ-AUTO", "BAJFINANCE", "BAJAJFINSV", "BPCL", "BHARTIARTL",
+    "BRITANNIA", "CIPLA", "COALINDIA", "DIVISLAB", "DRREDDY",
+    "EICHERMOT", "GRASIM", "HCLTECH", "HDFCBANK", "HDFCLIFE",
+    "HEROMOTOCO", "HINDALCO", "HINDUNILVR", "ICICIBANK", "ITC",
+    "INDUSINDBK", "INFY", "JSWSTEEL", "KOTAKBANK", "LT",
+    "M&M", "MARUTI", "NTPC", "NESTLEIND", "ONGC",
+    "POWERGRID", "RELIANCE", "SBILIFE", "SHREECEM", "SBIN",
+    "SUNPHARMA", "TCS", "TATACONSUM", "TATAMOTORS", "TATASTEEL",
+    "TECHM", "TITAN", "ULTRACEMCO", "UPL", "WIPRO"
+))
+
+# NIFTY Next 50 (for NIFTY 100)
+_NIFTY_NEXT50_NS = _with_ns_suffix((
+    "ADANIGREEN", "ADANIPOWER", "AMBUJACEM", "ATGL", "BAJAJHLDNG",
+    "BANDHANBNK", "BANKBARODA", "BERGEPAINT", "BEL", "BOSCHLTD",
+    "CANBK", "CHOLAFIN", "COLPAL", "DABUR", "DLF",
+    "DMART", "GAIL", "GODREJCP", "HAVELLS", "HDFCAMC",
+    "HINDZINC", "ICICIPRULI", "IDEA", "INDHOTEL", "INDIGO",
+    "IOC", "IRCTC", "IGL", "JINDALSTEL", "JIOFIN",
+    "LICHSGFIN", "LTIM", "MARICO", "MCDOWELL-N", "NYKAA",
+    "PAGEIND", "PIDILITIND", "PEL", "PERSISTENT", "PFC",
+    "PGHH", "PIDILITIND", "PNB", "RECLTD", "SBICARD",
+    "SHRIRAMFIN", "SIEMENS", "SRF", "TATAPOWER", "VEDL"
+))
+
+# Additional stocks for NIFTY 200
+_NIFTY200_EXTRA_NS = _with_ns_suffix((
+    "ACC", "ABFRL", "APOLLOTYRE", "ASHOKLEY", "AUROPHARMA",
+    "BALRAMCHIN", "BATAINDIA", "BHEL", "BIOCON", "BOSCHLTD",
+    "BRITANNIA", "CUMMINSIND", "ESCORTS", "EXIDEIND", "FEDERALBNK",
+    "GLENMARK", "GUJGASLTD", "HAVELLS", "HDFCAMC", "HINDCOPPER",
+    "HINDPETRO", "IBULHSGFIN", "IDFCFIRSTB", "INDIACEM", "INDUSTOWER",
+    "JUBLFOOD", "LTI", "LUPIN", "MRF", "MUTHOOTFIN",
+    "NATIONALUM", "NMDC", "OBEROIRLTY", "OFSS", "OIL",
+    "PAGEIND", "PETRONET", "PIIND", "PVR", "RAMCOCEM",
+    "SAIL", "SBICARD", "SRTRANSFIN", "TORNTPHARM", "TRENT",
+    "TVSMOTOR", "UBL", "MCDOWELL-N", "ZEEL", "ZYDUSLIFE",
+    # Add more as needed
+))
+
+# The lists overlap (e.g. BOSCHLTD, HAVELLS, PIDILITIND), so combined universes
+# are deduplicated; a repeated symbol would otherwise be fetched and scanned twice
+_NIFTY_FALLBACK_NS = {
+    'nifty50': _unique_symbols(_NIFTY50_NS),
+    'nifty100': _unique_symbols(_NIFTY50_NS, _NIFTY_NEXT50_NS),
+    # For NIFTY 200, we'll use a curated list of top 200 stocks
+    'nifty200': _unique_symbols(_NIFTY50_NS, _NIFTY_NEXT50_NS, _NIFTY200_EXTRA_NS),
+    # For NIFTY 500, recommend using CSV or smaller universe
+    'nifty500': _unique_symbols(_NIFTY50_NS, _NIFTY_NEXT50_NS, _NIFTY200_EXTRA_NS),
+}
+
+# NSE API index names and their (pre-encoded) endpoint URLs
+_NSE_INDEX_NAMES = {
+    'nifty50': 'NIFTY 50',
+    'nifty100': 'NIFTY 100',
+    'nifty200': 'NIFTY 200',
+    'nifty500': 'NIFTY 500',
+    'nifty_smallcap100': 'NIFTY SMALLCAP 100',
+    'nifty_smallcap250': 'NIFTY SMALLCAP 250',
+    'nifty_midcap150': 'NIFTY MIDCAP 150'
+}
+_NSE_URL_TEMPLATE = "https://www.nseindia.com/api/equity-stockIndices?index={}"
+_NSE_INDEX_URLS = {name: _NSE_URL_TEMPLATE.format(quote(nse_name)) for name, nse_name in _NSE_INDEX_NAMES.items()}
 
 
 class SymbolLoader:
     """Load NSE symbols dynamically from various sources"""
     
-    CACHE_FILE = "symbols_cache.pkl"
-    CACHE_DURATION_DAYS = 7  # Refresh weekly
+    CACHE_FILE = "symbols_cache.db"
+    CACHE_DURATION_DAYS = 7  # Refresh weekly (sources without their own entry below)
+    
+    # Freshness per source: broad indices rarely change membership. An entry past
+    # its duration but within twice it is still served while refreshing in the background.
+    SOURCE_CACHE_DURATION_DAYS = {
+        'nifty50': 7,
+        'nifty100': 14,
+        'nifty200': 30,
+        'nifty500': 30,
+        'csv': 1
+    }
+    
+    # Guards the set of in-flight background refreshes
+    _cache_lock = threading.Lock()
+    _refreshing: Set[Tuple[str, str]] = set()
+    
+    NSE_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+        'Accept': 'application/json',
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Referer': 'https://www.nseindia.com/'
+    }
+    
+    # Shared NSE session (keep-alive connection pool + cookies), created on first use
+    _session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()
     
     def __init__(self, cache_dir: str = None):
         if cache_dir is None:
@@ -48,12 +166,46 @@ class SymbolLoader:
         if not refresh:
             cached = self._load_from_cache(source)
             if cached:
-                print(f"📦 Loaded {len(cached)} symbols from cache")
-                return cached
+                symbols, stale = cached
+                if stale:
+                    self._refresh_in_background(source)
+                print(f"📦 Loaded {len(symbols)} symbols from cache")
+                return symbols
         
         # Fetch fresh symbols
         print(f"🔄 Fetching symbols from {source}...")
+        symbols = self._fetch_symbols(source)
         
+        if symbols:
+            self._save_to_cache(source, symbols)
+            print(f"✅ Loaded {len(symbols)} symbols")
+        
+        return symbols
+    
+    def get_symbols_multi(self, sources: List[str], refresh: bool = False) -> Dict[str, List[str]]:
+        """
+        Get symbols for several sources at once
+        
+        Sources are loaded concurrently (cache hits return immediately; NSE fetches
+        share the keep-alive session, which is primed only once).
+        
+        Args:
+            sources: Sources accepted by get_symbols()
+            refresh: Force refresh cache
+            
+        Returns:
+            Dict mapping each source to its list of symbols
+        """
+        sources = list(dict.fromkeys(sources))
+        if not sources:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(4, len(sources))) as executor:
+            results = executor.map(lambda source: self.get_symbols(source, refresh), sources)
+            return dict(zip(sources, results))
+    
+    def _fetch_symbols(self, source: str) -> List[str]:
+        """Fetch symbols from the source itself (deduplicated), bypassing the cache"""
         if source == "csv":
             symbols = self._load_from_csv()
         elif source.startswith("nifty"):
@@ -61,12 +213,51 @@ class SymbolLoader:
             symbols = self._load_nifty_index(source)
         else:
             raise ValueError(f"Unknown source: {source}")
+        return list(_unique_symbols(symbols))
+    
+    def _refresh_in_background(self, source: str):
+        """Re-fetch a stale source on a daemon thread (at most one refresh per source)"""
+        key = (self.cache_path, source)
+        with self._cache_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        
+        def refresh():
+            try:
+                symbols = self._fetch_symbols(source)
+                if symbols:
+                    self._save_to_cache(source, symbols)
+            finally:
+                with self._cache_lock:
+                    self._refreshing.discard(key)
+        
+        threading.Thread(target=refresh, name=f"symbols-refresh-{source}", daemon=True).start()
+    
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """
+        NSE session shared by all loaders
         
-        if symbols:
-            self._save_to_cache(source, symbols)
-            print(f"✅ Loaded {len(symbols)} symbols")
-        
-        return symbols
+        The cookie-priming request to the NSE home page only happens when the
+        session is created; later index fetches reuse its cookies and pooled
+        connections. A failed priming request propagates and nothing is cached.
+        """
+        with cls._session_lock:
+            if cls._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                      max_retries=Retry(total=2, backoff_factor=0.3))
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.headers.update(cls.NSE_HEADERS)
+                
+                # First request to get cookies (NSE sometimes requires this)
+                session.get('https://www.nseindia.com', timeout=10)
+                time.sleep(0.5)  # Small delay to avoid rate limiting
+                
+                cls._session = session
+            return cls._session
     
     def _fetch_from_nse_api(self, index_name: str) -> Optional[List[str]]:
         """
@@ -78,46 +269,20 @@ class SymbolLoader:
         Returns:
             List of symbols with .NS suffix, or None if API fails
         """
-        # Map index names to NSE API format
-        index_map = {
-            'nifty50': 'NIFTY 50',
-            'nifty100': 'NIFTY 100',
-            'nifty200': 'NIFTY 200',
-            'nifty500': 'NIFTY 500',
-            'nifty_smallcap100': 'NIFTY SMALLCAP 100',
-            'nifty_smallcap250': 'NIFTY SMALLCAP 250',
-            'nifty_midcap150': 'NIFTY MIDCAP 150'
-        }
-        
-        nse_index_name = index_map.get(index_name, 'NIFTY 50')
+        # Map index names to NSE API format (unknown indices use NIFTY 50)
+        if index_name not in _NSE_INDEX_NAMES:
+            index_name = 'nifty50'
+        nse_index_name = _NSE_INDEX_NAMES[index_name]
         
         try:
-            # NSE API endpoint
-            url = f"https://www.nseindia.com/api/equity-stockIndices?index={nse_index_name.replace(' ', '%20')}"
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-                'Accept': 'application/json',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Referer': 'https://www.nseindia.com/'
-            }
-            
-            # Create session for cookie handling
-            session = requests.Session()
-            session.headers.update(headers)
-            
-            # First request to get cookies (NSE sometimes requires this)
-            session.get('https://www.nseindia.com', timeout=10)
-            time.sleep(0.5)  # Small delay to avoid rate limiting
-            
-            # Fetch index data
-            response = session.get(url, timeout=10)
+            # Fetch index data over the shared keep-alive session
+            response = self._get_session().get(_NSE_INDEX_URLS[index_name], timeout=10)
             
             if response.status_code != 200:
                 print(f"⚠️  NSE API returned status {response.status_code}")
                 return None
             
-            data = response.json()
+            data = _json.loads(response.content)
             
             if 'data' not in data or not isinstance(data['data'], list):
                 print(f"⚠️  NSE API response format unexpected")
@@ -164,66 +329,16 @@ class SymbolLoader:
         # Fallback to hardcoded lists
         print(f"⚠️  NSE API failed, using hardcoded list for {index_name}")
         
-        # NIFTY 50 symbols (most liquid)
-        nifty50 = [
-            "ADANIENT", "ADANIPORTS", "APOLLOHOSP", "ASIANPAINT", "AXISBANK",
-            "BAJAJ-AUTO", "BAJFINANCE", "BAJAJFINSV", "BPCL", "BHARTIARTL",
-            "BRITANNIA", "CIPLA", "COALINDIA", "DIVISLAB", "DRREDDY",
-            "EICHERMOT", "GRASIM", "HCLTECH", "HDFCBANK", "HDFCLIFE",
-            "HEROMOTOCO", "HINDALCO", "HINDUNILVR", "ICICIBANK", "ITC",
-            "INDUSINDBK", "INFY", "JSWSTEEL", "KOTAKBANK", "LT",
-            "M&M", "MARUTI", "NTPC", "NESTLEIND", "ONGC",
-            "POWERGRID", "RELIANCE", "SBILIFE", "SHREECEM", "SBIN",
-            "SUNPHARMA", "TCS", "TATACONSUM", "TATAMOTORS", "TATASTEEL",
-            "TECHM", "TITAN", "ULTRACEMCO", "UPL", "WIPRO"
-        ]
-        
-        # NIFTY Next 50 (for NIFTY 100)
-        nifty_next50 = [
-            "ADANIGREEN", "ADANIPOWER", "AMBUJACEM", "ATGL", "BAJAJHLDNG",
-            "BANDHANBNK", "BANKBARODA", "BERGEPAINT", "BEL", "BOSCHLTD",
-            "CANBK", "CHOLAFIN", "COLPAL", "DABUR", "DLF",
-            "DMART", "GAIL", "GODREJCP", "HAVELLS", "HDFCAMC",
-            "HINDZINC", "ICICIPRULI", "IDEA", "INDHOTEL", "INDIGO",
-            "IOC", "IRCTC", "IGL", "JINDALSTEL", "JIOFIN",
-            "LICHSGFIN", "LTIM", "MARICO", "MCDOWELL-N", "NYKAA",
-            "PAGEIND", "PIDILITIND", "PEL", "PERSISTENT", "PFC",
-            "PGHH", "PIDILITIND", "PNB", "RECLTD", "SBICARD",
-            "SHRIRAMFIN", "SIEMENS", "SRF", "TATAPOWER", "VEDL"
-        ]
-        
-        if index_name == "nifty50":
-            symbols = nifty50
-        elif index_name == "nifty100":
-            symbols = nifty50 + nifty_next50
-        elif index_name == "nifty200":
-            # For NIFTY 200, we'll use a curated list of top 200 stocks
-            symbols = nifty50 + nifty_next50 + self._get_additional_nifty200()
-        elif index_name == "nifty500":
-            # For NIFTY 500, recommend using CSV or smaller universe
+        if index_name == "nifty500":
             print("⚠️  NIFTY 500 is large. Consider using NIFTY 200 or CSV file.")
-            symbols = nifty50 + nifty_next50 + self._get_additional_nifty200()
-        else:
-            symbols = nifty50
         
-        # Add .NS suffix for Yahoo Finance
-        return [f"{symbol}.NS" for symbol in symbols]
+        return list(_NIFTY_FALLBACK_NS.get(index_name, _NIFTY_FALLBACK_NS['nifty50']))
     
-    def _get_additional_nifty200(self) -> List[str]:
-        """Additional stocks for NIFTY 200"""
-        return [
-            "ACC", "ABFRL", "APOLLOTYRE", "ASHOKLEY", "AUROPHARMA",
-            "BALRAMCHIN", "BATAINDIA", "BHEL", "BIOCON", "BOSCHLTD",
-            "BRITANNIA", "CUMMINSIND", "ESCORTS", "EXIDEIND", "FEDERALBNK",
-            "GLENMARK", "GUJGASLTD", "HAVELLS", "HDFCAMC", "HINDCOPPER",
-            "HINDPETRO", "IBULHSGFIN", "IDFCFIRSTB", "INDIACEM", "INDUSTOWER",
-            "JUBLFOOD", "LTI", "LUPIN", "MRF", "MUTHOOTFIN",
-            "NATIONALUM", "NMDC", "OBEROIRLTY", "OFSS", "OIL",
-            "PAGEIND", "PETRONET", "PIIND", "PVR", "RAMCOCEM",
-            "SAIL", "SBICARD", "SRTRANSFIN", "TORNTPHARM", "TRENT",
-            "TVSMOTOR", "UBL", "MCDOWELL-N", "ZEEL", "ZYDUSLIFE",
-            # Add more as needed
-        ]
+    @staticmethod
+    def _normalize_symbols(symbols: pd.Series) -> pd.Series:
+        """Strip and uppercase symbols, adding the .NS suffix where missing and dropping repeats (vectorized)"""
+        symbols = symbols.dropna().astype(str).str.strip().str.upper()
+        return symbols.where(symbols.str.endswith('.NS'), symbols + '.NS').drop_duplicates()
     
     def _load_from_csv(self, csv_path: str = "symbols.csv") -> List[str]:
         """
@@ -247,12 +362,8 @@ class SymbolLoader:
                 print("❌ CSV must have 'symbol' column")
                 return []
             
-            symbols = df['symbol'].tolist()
-            
             # Add .NS suffix if not present
-            symbols = [s if s.endswith('.NS') else f"{s}.NS" for s in symbols]
-            
-            return symbols
+            return self._normalize_symbols(df['symbol']).tolist()
         
         except FileNotFoundError:
             print(f"❌ CSV file not found: {csv_path}")
@@ -262,56 +373,97 @@ class SymbolLoader:
             print(f"❌ Error loading CSV: {e}")
             return []
     
-    def _load_from_cache(self, source: str) -> Optional[List[str]]:
-        """Load symbols from cache if not expired"""
+    def _cache_connection(self) -> sqlite3.Connection:
+        """
+        Open the symbol cache (SQLite, one row per source)
+        
+        Lookups read only the requested source's row, through a memory-mapped file,
+        and each save is a single transaction, so a partial write is never visible.
+        """
+        conn = sqlite3.connect(self.cache_path, timeout=10)
+        conn.execute("PRAGMA mmap_size = 1048576")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS symbol_cache (
+                source TEXT PRIMARY KEY,
+                cached_at TEXT NOT NULL,
+                symbols_json TEXT NOT NULL
+            )
+        """)
+        return conn
+    
+    def _load_from_cache(self, source: str) -> Optional[Tuple[List[str], bool]]:
+        """
+        Load symbols from cache if not expired
+        
+        Returns:
+            (symbols, stale) where stale means past the source's cache duration but
+            still servable, or None if missing or expired
+        """
         if not os.path.exists(self.cache_path):
             return None
         
         try:
-            with open(self.cache_path, 'rb') as f:
-                cache_data = pickle.load(f)
+            with closing(self._cache_connection()) as conn:
+                row = conn.execute(
+                    "SELECT cached_at, symbols_json FROM symbol_cache WHERE source = ?", (source,)
+                ).fetchone()
             
-            if source not in cache_data:
+            if row is None:
                 return None
             
-            cached_time, symbols = cache_data[source]
+            cached_time = datetime.fromisoformat(row[0])
+            symbols = list(_unique_symbols(json.loads(row[1])))
             
             # Check if cache is expired
-            if datetime.now() - cached_time > timedelta(days=self.CACHE_DURATION_DAYS):
+            age = datetime.now() - cached_time
+            duration = timedelta(days=self.SOURCE_CACHE_DURATION_DAYS.get(source, self.CACHE_DURATION_DAYS))
+            if age > duration * 2:
                 print("⏰ Cache expired, will refresh")
                 return None
             
-            return symbols
+            return symbols, age > duration
         
         except Exception as e:
             print(f"⚠️  Cache load error: {e}")
             return None
     
     def _save_to_cache(self, source: str, symbols: List[str]):
-        """Save symbols to cache"""
+        """Save symbols to cache (replaces only this source's entry)"""
         try:
-            # Load existing cache
-            cache_data = {}
-            if os.path.exists(self.cache_path):
-                with open(self.cache_path, 'rb') as f:
-                    cache_data = pickle.load(f)
-            
-            # Update with new data
-            cache_data[source] = (datetime.now(), symbols)
-            
-            # Save
-            with open(self.cache_path, 'wb') as f:
-                pickle.dump(cache_data, f)
+            with closing(self._cache_connection()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO symbol_cache (source, cached_at, symbols_json) VALUES (?, ?, ?)",
+                    (source, datetime.now().isoformat(), json.dumps(list(symbols)))
+                )
             
             print(f"💾 Cached {len(symbols)} symbols")
         
         except Exception as e:
             print(f"⚠️  Cache save error: {e}")
     
+    @staticmethod
+    def _count_valid(symbols: List[str]) -> int:
+        """Number of symbols Yahoo Finance returns recent history for (one batched download)"""
+        # Existence check only: raw prices, no adjustment pass over the payload
+        try:
+            data = yf.download(symbols, period="1d", group_by='ticker', threads=True, progress=False,
+                               auto_adjust=False)
+        except Exception:
+            return 0
+        
+        if data is None or data.empty:
+            return 0
+        if not isinstance(data.columns, pd.MultiIndex):
+            # Single-level columns: a lone ticker's OHLCV
+            return int(not data.dropna(how='all').empty)
+        
+        tickers = set(data.columns.get_level_values(0))
+        return sum(1 for symbol in symbols if symbol in tickers and not data[symbol].dropna(how='all').empty)
+    
     def validate_symbols(self, symbols: List[str], sample_size: int = 10) -> List[str]:
         """
         Validate that symbols are tradeable on Yahoo Finance
-        Tests a sample to avoid rate limits
+        Tests a sample to avoid rate limits; the sample is fetched in one batched download
         
         Args:
             symbols: List of symbols to validate
@@ -325,19 +477,11 @@ class SymbolLoader:
         
         print(f"🔍 Validating symbols (testing {min(sample_size, len(symbols))} samples)...")
         
-        # Test a sample
+        # Test a sample (sampling indices from a range avoids copying the list)
         import random
-        test_symbols = random.sample(symbols, min(sample_size, len(symbols)))
+        test_symbols = [symbols[i] for i in random.sample(range(len(symbols)), min(sample_size, len(symbols)))]
         
-        valid_count = 0
-        for symbol in test_symbols:
-            try:
-                ticker = yf.Ticker(symbol)
-                info = ticker.history(period="1d")
-                if not info.empty:
-                    valid_count += 1
-            except:
-                pass
+        valid_count = self._count_valid(test_symbols)
         
         success_rate = valid_count / len(test_symbols)
         
@@ -358,12 +502,10 @@ class SymbolLoader:
             output_file: Output CSV filename
         """
         # Ensure .NS suffix
-        symbols = [s if s.endswith('.NS') else f"{s}.NS" for s in symbols]
-        
-        df = pd.DataFrame({'symbol': symbols})
+        df = pd.DataFrame({'symbol': self._normalize_symbols(pd.Series(symbols, dtype=object))})
         df.to_csv(output_file, index=False)
         
-        print(f"✅ Created {output_file} with {len(symbols)} symbols")
+        print(f"✅ Created {output_file} with {len(df)} symbols")
         print(f"   Use: config.load_symbols('csv', csv_path='{output_file}')")
 
 
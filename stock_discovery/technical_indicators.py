@@ -2,72 +2,122 @@
 AI-Powered Stock Discovery Tool - Technical Indicators
 """
 
+import functools
+import weakref
 import numpy as np
 import pandas as pd
-from typing import Dict
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Dict, List, Optional, Tuple, Iterator
+
+
+# Per-DataFrame indicator memo: id(df) -> {(indicator, len, last index, args): value}.
+# Several strategies (and the scoring engine) evaluate the same indicators on the
+# same daily frame; entries are dropped when the frame is garbage collected so a
+# recycled id() can never return stale values.
+_INDICATOR_MEMO: Dict[int, Dict[tuple, object]] = {}
+
+
+def _memoized_indicator(func):
+    """Memoize an indicator per DataFrame, keyed by (len, last index label, args)"""
+    @functools.wraps(func)
+    def wrapper(df, *args, **kwargs):
+        if df is None or df.empty:
+            return func(df, *args, **kwargs)
+        
+        df_id = id(df)
+        memo = _INDICATOR_MEMO.get(df_id)
+        if memo is None:
+            memo = _INDICATOR_MEMO[df_id] = {}
+            weakref.finalize(df, _INDICATOR_MEMO.pop, df_id, None)
+        
+        key = (func.__name__, len(df), df.index[-1], args, tuple(sorted(kwargs.items())))
+        if key not in memo:
+            memo[key] = func(df, *args, **kwargs)
+        
+        value = memo[key]
+        return dict(value) if isinstance(value, dict) else value
+    
+    return wrapper
 
 
 class TechnicalIndicators:
     """Calculate technical indicators"""
     
+    OHLCV_COLUMNS = ('high', 'low', 'close', 'volume')
+    
+    @staticmethod
+    def as_pandas(df):
+        """
+        pandas view of a strategy input frame
+        
+        Polars (or any Arrow-backed) frames are converted once at the strategy
+        boundary via their to_pandas(); pandas frames and None pass through.
+        """
+        if df is None or isinstance(df, pd.DataFrame):
+            return df
+        return df.to_pandas()
+    
     @staticmethod
+    def is_valid_ohlcv(df: Optional[pd.DataFrame], min_bars: int = 1) -> bool:
+        """True if df has at least min_bars rows and finite high/low/close/volume columns"""
+        if (df is None or len(df) < min_bars
+                or not all(column in df.columns for column in TechnicalIndicators.OHLCV_COLUMNS)):
+            return False
+        # Strategies reduce raw ndarrays, which don't skip NaN like pandas did, so a
+        # single missing bar would quietly fail every gate; reject the frame instead
+        values = df[list(TechnicalIndicators.OHLCV_COLUMNS)].to_numpy(dtype=np.float64)
+        return bool(np.isfinite(values).all())
+    
+    @staticmethod
+    @_memoized_indicator
     def calculate_vwap(df: pd.DataFrame) -> float:
         """Volume-weighted average price"""
         if df is None or df.empty or 'close' not in df or 'volume' not in df:
             return 0.0
         
-        typical_price = (df['high'] + df['low'] + df['close']) / 3
-        total_volume = df['volume'].sum()
+        volume = df['volume'].to_numpy(dtype=np.float64)
+        total_volume = volume.sum()
         
         if total_volume == 0:
             return 0.0
         
-        vwap = (typical_price * df['volume']).sum() / total_volume
-        return float(vwap)
+        # sum((h + l + c) / 3 * v) as three dot products, without a typical-price array
+        price_volume = (np.dot(df['high'].to_numpy(), volume)
+                        + np.dot(df['low'].to_numpy(), volume)
+                        + np.dot(df['close'].to_numpy(), volume)) / 3
+        return float(price_volume / total_volume)
     
     @staticmethod
+    @_memoized_indicator
     def calculate_atr(df: pd.DataFrame, period: int = 14) -> float:
         """Average True Range"""
         if df is None or df.empty or len(df) < period:
             return 0.0
         
-        high = df['high'].values
-        low = df['low'].values
-        close = df['close'].values
-        
-        # Calculate true range
-        tr1 = high - low
-        tr2 = np.abs(high - np.roll(close, 1))
-        tr3 = np.abs(low - np.roll(close, 1))
+        if len(df) < period + 1:
+            return 0.0  # Need `period` true ranges, each against a previous close
         
-        tr = np.maximum(tr1, np.maximum(tr2, tr3))
-        
-        # Skip first value (has rolled data)
-        tr = tr[1:]
-        
-        if len(tr) < period:
-            return 0.0
+        # True range of the last `period` bars only, against the previous bar's close
+        # (slices of the column views, so nothing outside the window is touched)
+        high = df['high'].to_numpy()[-period:]
+        low = df['low'].to_numpy()[-period:]
+        prev_close = df['close'].to_numpy()[-(period + 1):-1]
         
-        atr = np.mean(tr[-period:])
-        return float(atr)
+        tr = np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+        return float(np.mean(tr))
     
     @staticmethod
+    @_memoized_indicator
     def calculate_rsi(df: pd.DataFrame, period: int = 14) -> float:
         """Relative Strength Index"""
         if df is None or df.empty or len(df) < period + 1:
             return 50.0
         
-        close = df['close'].values
-        delta = np.diff(close)
-        
-        gains = np.where(delta > 0, delta, 0)
-        losses = np.where(delta < 0, -delta, 0)
-        
-        if len(gains) < period:
-            return 50.0
+        # Only the last `period` changes are averaged, so diff just that window
+        delta = np.diff(df['close'].to_numpy()[-(period + 1):])
         
-        avg_gain = np.mean(gains[-period:])
-        avg_loss = np.mean(losses[-period:])
+        avg_gain = np.clip(delta, 0, None).mean()
+        avg_loss = -np.clip(delta, None, 0).mean()
         
         if avg_loss == 0:
             return 100.0
@@ -77,6 +127,14 @@ class TechnicalIndicators:
         return float(rsi)
     
     @staticmethod
+    def last_sma(close: np.ndarray, window: int) -> float:
+        """Latest simple moving average value only (last close if history is too short)"""
+        if len(close) >= window:
+            return close[-window:].mean()
+        return close[-1]
+    
+    @staticmethod
+    @_memoized_indicator
     def calculate_moving_averages(df: pd.DataFrame, short: int = 20, long: int = 50) -> Dict:
         """Calculate short and long MAs"""
         if df is None or df.empty:
@@ -86,10 +144,11 @@ class TechnicalIndicators:
                 'ma_cross': False
             }
         
-        close = df['close'].values
+        # Both averages come from one trailing window of closes
+        tail = df['close'].to_numpy()[-max(short, long):]
         
-        ma_short = np.mean(close[-short:]) if len(close) >= short else close[-1]
-        ma_long = np.mean(close[-long:]) if len(close) >= long else close[-1]
+        ma_short = TechnicalIndicators.last_sma(tail, short)
+        ma_long = TechnicalIndicators.last_sma(tail, long)
         
         return {
             'ma_short': float(ma_short),
@@ -98,6 +157,66 @@ class TechnicalIndicators:
         }
     
     @staticmethod
+    @_memoized_indicator
+    def compute_all(df: pd.DataFrame, period: int = 14, short: int = 20, long: int = 50) -> Dict:
+        """
+        VWAP, ATR, RSI and moving averages in one pass over shared column arrays
+        
+        Values match calculate_vwap/atr/rsi/moving_averages called with the same
+        arguments; each column is pulled out of the frame once.
+        
+        Returns:
+            Dict with 'vwap', 'atr', 'rsi', 'ma_short', 'ma_long', 'ma_cross'
+        """
+        result = {
+            'vwap': 0.0,
+            'atr': 0.0,
+            'rsi': 50.0,
+            'ma_short': 0.0,
+            'ma_long': 0.0,
+            'ma_cross': False
+        }
+        if df is None or df.empty:
+            return result
+        
+        close = df['close'].to_numpy()
+        
+        if 'volume' in df:
+            volume = df['volume'].to_numpy(dtype=np.float64)
+            total_volume = volume.sum()
+            if total_volume != 0:
+                high_all = df['high'].to_numpy()
+                low_all = df['low'].to_numpy()
+                price_volume = (np.dot(high_all, volume) + np.dot(low_all, volume)
+                                + np.dot(close, volume)) / 3
+                result['vwap'] = float(price_volume / total_volume)
+        
+        if len(close) >= period + 1:
+            # ATR and RSI both work on the last `period` bars against the previous close
+            window = close[-(period + 1):]
+            prev_close = window[:-1]
+            
+            high = df['high'].to_numpy()[-period:]
+            low = df['low'].to_numpy()[-period:]
+            tr = np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+            result['atr'] = float(np.mean(tr))
+            
+            delta = np.diff(window)
+            avg_gain = np.clip(delta, 0, None).mean()
+            avg_loss = -np.clip(delta, None, 0).mean()
+            result['rsi'] = 100.0 if avg_loss == 0 else float(100 - (100 / (1 + avg_gain / avg_loss)))
+        
+        tail = close[-max(short, long):]
+        ma_short = TechnicalIndicators.last_sma(tail, short)
+        ma_long = TechnicalIndicators.last_sma(tail, long)
+        result['ma_short'] = float(ma_short)
+        result['ma_long'] = float(ma_long)
+        result['ma_cross'] = ma_short > ma_long
+        
+        return result
+    
+    @staticmethod
+    @_memoized_indicator
     def calculate_volatility_percentile(df: pd.DataFrame, lookback: int = 60) -> float:
         """Calculate volatility percentile (for HVB mode)"""
         if df is None or df.empty or len(df) < lookback:
@@ -107,18 +226,69 @@ class TechnicalIndicators:
         close = df['close'].values
         returns = np.diff(close) / close[:-1]
         
-        # Current volatility (last 20 days)
-        current_vol = np.std(returns[-20:]) if len(returns) >= 20 else np.std(returns)
+        if len(returns) <= 20:
+            return 50.0  # No historical windows to rank against
         
-        # Historical volatility distribution
-        rolling_vol = []
-        for i in range(20, len(returns)):
-            vol = np.std(returns[i-20:i])
-            rolling_vol.append(vol)
-        
-        if not rolling_vol:
-            return 50.0
+        # Rolling 20-day volatility; the last window is the current volatility and
+        # the earlier ones (returns[i-20:i] for i in 20..len-1) are the history.
+        # Same reduction as the panel version, so the strict comparisons below
+        # agree bit for bit (an online Welford update would not)
+        rolling_vol = sliding_window_view(returns, 20).std(axis=1)
+        current_vol = rolling_vol[-1]
         
         # Percentile rank
-        percentile = (np.sum(np.array(rolling_vol) < current_vol) / len(rolling_vol)) * 100
+        percentile = (np.sum(rolling_vol[:-1] < current_vol) / (len(rolling_vol) - 1)) * 100
         return float(percentile)
+    
+    # ------------------------------------------------------------------
+    # Panel (batch) indicators: arrays shaped (n_symbols, n_bars), one row per symbol.
+    # Each matches its per-symbol counterpart above, evaluated row-wise.
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def panels_by_length(dfs: Dict[str, pd.DataFrame], min_bars: int = 1,
+                         fields: Tuple[str, ...] = ('open', 'high', 'low', 'close', 'volume'),
+                         price_dtype: type = np.float64
+                         ) -> Iterator[Tuple[List[str], Dict[str, np.ndarray]]]:
+        """
+        Stack OHLCV frames into per-field (n_symbols, n_bars) arrays, grouped by bar count
+        
+        Frames are grouped by length so every row covers its symbol's full history.
+        Symbols with missing data or fewer than min_bars rows are skipped.
+        
+        Price fields use price_dtype. It defaults to float64 because strategies use
+        these panels as hard gates before analyze(), and float32 rounding flips the
+        strict comparisons (e.g. tied volatility windows) that analyze() makes in
+        float64. Only pass float32 for panels that don't gate per-symbol results.
+        Volume is always float64 since daily volumes exceed float32's 2**24
+        exact-integer range.
+        
+        Yields:
+            (symbols, panel) where panel maps field name -> 2D array
+        """
+        groups: Dict[int, List[str]] = {}
+        for symbol, df in dfs.items():
+            if df is None or len(df) < min_bars:
+                continue
+            groups.setdefault(len(df), []).append(symbol)
+        
+        for symbols in groups.values():
+            panel = {}
+            for field in fields:
+                dtype = np.float64 if field == 'volume' else price_dtype
+                panel[field] = np.vstack([dfs[symbol][field].to_numpy(dtype=dtype) for symbol in symbols])
+            yield symbols, panel
+    
+    @staticmethod
+    def volatility_percentile_panel(close: np.ndarray, lookback: int = 60) -> np.ndarray:
+        """Volatility percentile per row (for HVB mode)"""
+        n_symbols, n_bars = close.shape
+        if n_bars < lookback or n_bars < 22:
+            return np.full(n_symbols, 50.0)
+        
+        returns = np.diff(close, axis=1) / close[:, :-1]
+        current_vol = returns[:, -20:].std(axis=1)
+        
+        # Rolling 20-bar std of returns[i-20:i] for i in 20..len(returns)-1
+        rolling_vol = sliding_window_view(returns[:, :-1], 20, axis=1).std(axis=2)
+        return (rolling_vol < current_vol[:, None]).sum(axis=1) / rolling_vol.shape[1] * 100
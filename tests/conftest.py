@@ -0,0 +1,156 @@
+"""
+Shared pytest fixtures
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stock_discovery.config import Config
+from stock_discovery.database import PickLedger
+from stock_discovery.symbol_loader import SymbolLoader
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+SAMPLE_OHLCV_PATH = os.path.join(FIXTURES_DIR, "sample_ohlcv.csv")
+
+
+def _make_sample_ohlcv():
+    """100 daily bars of seeded random-walk OHLCV"""
+    import numpy as np
+    import pandas as pd
+
+    # Four random walks drawn as one (4, 100) block
+    rng = np.random.default_rng(42)
+    prices = rng.standard_normal((4, 100)).cumsum(axis=1) + np.array([100, 102, 98, 100])[:, None]
+    df = pd.DataFrame(prices.T, columns=["open", "high", "low", "close"])
+    df.insert(0, "datetime", pd.date_range("2024-01-01", periods=100, freq="D"))
+    df["volume"] = rng.integers(100000, 1000000, 100)
+    return df
+
+
+def pytest_addoption(parser):
+    parser.addoption("--run-network", action="store_true", default=False,
+                     help="run tests marked 'network' against live market data services")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-network"):
+        return
+    skip_network = pytest.mark.skip(reason="needs --run-network")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
+
+
+def pytest_sessionstart(session):
+    if not os.path.exists(SAMPLE_OHLCV_PATH):
+        _make_sample_ohlcv().to_csv(SAMPLE_OHLCV_PATH, index=False, float_format="%.10f")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def offline_symbols(tmp_path_factory):
+    """
+    Keep SymbolLoader off the network and out of data/
+
+    The NSE API always "fails", so loaders use their hardcoded lists, and a
+    loader built without a cache_dir caches under a per-session temp directory
+    (one per xdist worker) instead of the repo's shared data/symbols_cache.db.
+    """
+    default_cache_dir = str(tmp_path_factory.mktemp("symbols_cache"))
+    init = SymbolLoader.__init__
+
+    def offline_init(self, cache_dir=None):
+        init(self, cache_dir or default_cache_dir)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(SymbolLoader, "__init__", offline_init)
+        mp.setattr(SymbolLoader, "_fetch_from_nse_api", lambda self, index_name: None)
+        yield default_cache_dir
+
+
+@pytest.fixture(scope="session")
+def config():
+    """One Config per session (construction loads the symbol universe)"""
+    return Config()
+
+
+@pytest.fixture(scope="session")
+def ohlcv():
+    """Sample daily OHLCV read once per session from tests/fixtures/"""
+    import pandas as pd
+
+    return pd.read_csv(SAMPLE_OHLCV_PATH, parse_dates=["datetime"])
+
+
+@pytest.fixture(scope="module")
+def ledger():
+    """In-memory PickLedger shared by a test module; tests use unique pick_ids"""
+    return PickLedger(":memory:")
+
+
+class _RecordedTicker:
+    """Stand-in for yfinance.Ticker that replays daily history saved under tests/fixtures/"""
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+
+    def history(self, period: str = "5d", interval: str = "1d"):
+        import pandas as pd
+
+        path = os.path.join(FIXTURES_DIR, f"{self.symbol.lstrip('^')}.csv")
+        if interval != "1d" or not os.path.exists(path):
+            return pd.DataFrame()
+        df = pd.read_csv(path)
+        df["Date"] = pd.to_datetime(df["Date"])
+        df = df.set_index("Date")
+        if period.endswith("d"):
+            df = df.tail(int(period[:-1]))
+        return df
+
+
+def _recorded_download(tickers, period="5d", interval="1d", group_by="column", **kwargs):
+    """Stand-in for yfinance.download(group_by='ticker') built from the recorded histories"""
+    import pandas as pd
+
+    frames = {}
+    for symbol in tickers:
+        df = _RecordedTicker(symbol).history(period=period, interval=interval)
+        if not df.empty:
+            frames[symbol] = df
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, axis=1)
+
+
+@pytest.fixture
+def mock_yf(monkeypatch):
+    """Serve MarketDataFetcher from recorded Yahoo responses instead of the network"""
+    from stock_discovery import data_fetcher
+
+    monkeypatch.setattr(data_fetcher.yf, "Ticker", _RecordedTicker)
+    monkeypatch.setattr(data_fetcher.yf, "download", _recorded_download)
+
+
+class FakeMarketDataFetcher:
+    """In-memory MarketDataFetcher serving the sample OHLCV for every symbol"""
+
+    def __init__(self, daily_df, index_trend: str = "bullish"):
+        self.daily_df = daily_df
+        self.index_trend = index_trend
+
+    def get_stock_data(self, symbol: str, period: str = "5d", interval: str = "1d"):
+        if period.endswith("d"):
+            return self.daily_df.tail(int(period[:-1])).reset_index(drop=True)
+        return self.daily_df.copy()
+
+    def get_index_trend(self, index_symbol: str = "^NSEI") -> str:
+        return self.index_trend
+
+
+@pytest.fixture
+def fake_fetcher(ohlcv):
+    """Network-free stand-in for MarketDataFetcher instances"""
+    return FakeMarketDataFetcher(ohlcv)
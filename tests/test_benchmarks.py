@@ -0,0 +1,60 @@
+"""
+Performance regression benchmarks (needs pytest-benchmark)
+
+Record a baseline, then compare later runs against it:
+    pytest tests/test_benchmarks.py --benchmark-save=baseline
+    pytest tests/test_benchmarks.py --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+
+import itertools
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stock_discovery.technical_indicators import TechnicalIndicators
+
+
+@pytest.mark.benchmark(group="indicators", min_rounds=100)
+@pytest.mark.parametrize("indicator", [
+    TechnicalIndicators.calculate_rsi,
+    TechnicalIndicators.calculate_atr,
+    TechnicalIndicators.calculate_vwap,
+    TechnicalIndicators.calculate_volatility_percentile,
+], ids=lambda func: func.__name__)
+def test_indicator_perf(benchmark, ohlcv, indicator):
+    """Time one indicator on the sample frame, bypassing the per-frame memo"""
+    benchmark(indicator.__wrapped__, ohlcv)
+
+
+@pytest.mark.benchmark(group="database", min_rounds=100)
+def test_save_pick_perf(benchmark, ledger):
+    """Time inserting one pick"""
+    ids = itertools.count()
+    
+    def save():
+        ledger.save_pick({
+            'pick_id': f"BENCH_PICK_{next(ids)}",
+            'symbol': 'RELIANCE.NS',
+            'strategy': 'ORB',
+            'timestamp': '2024-01-15T09:30:00',
+            'conviction_score': 85.0,
+            'risk_score': 50.0,
+            'entry_price': 2950.0,
+            'stop_loss': 2920.0,
+            'target_price': 3000.0,
+            'position_size': 10.0,
+            'features': {'test': True}
+        })
+    
+    benchmark(save)
+
+
+@pytest.mark.benchmark(group="database", min_rounds=100)
+def test_save_outcome_perf(benchmark, ledger):
+    """Time recording one outcome"""
+    benchmark(ledger.save_outcome, 'BENCH_OUTCOME', 5.0, -2.0, 3.5, True, False)
@@ -1,124 +1,89 @@
 """
-Test script to verify all components
+Component tests
+
+Plain pytest functions with no ordering between them, so the module can be
+spread across workers:  pytest tests/test_components.py -n auto --dist=loadfile
 """
 
+import logging
 import sys
 import os
+import uuid
+
+import numpy as np
+import pandas as pd
+import pytest
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-def test_imports():
-    """Test that all modules import correctly"""
-    print("Testing imports...")
-    
-    try:
-        from stock_discovery.config import Config
-        print("  ✓ config")
-        
-        from stock_discovery.database import PickLedger
-        print("  ✓ database")
-        
-        from stock_discovery.data_fetcher import MarketDataFetcher
-        print("  ✓ data_fetcher")
-        
-        from stock_discovery.technical_indicators import TechnicalIndicators
-        print("  ✓ technical_indicators")
-        
-        from stock_discovery.learning import LearningEngine
-        print("  ✓ learning")
-        
-        from stock_discovery.strategies.orb_strategy import OpeningRangeBreakout
-        from stock_discovery.strategies.vwap_strategy import VWAPPullback
-        from stock_discovery.strategies.momentum_strategy import MomentumSwing
-        from stock_discovery.strategies.hvb_strategy import HighVolatilityBreakout
-        print("  ✓ all strategies")
-        
-        from stock_discovery.scanner_engine import ScannerEngine
-        print("  ✓ scanner_engine")
-        
-        from stock_discovery.output_formatter import OutputFormatter
-        print("  ✓ output_formatter")
-        
-        print("\n✅ All imports successful!")
-        return True
-        
-    except Exception as e:
-        print(f"\n❌ Import failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-def test_config():
+from stock_discovery.data_fetcher import MarketDataFetcher
+from stock_discovery.database import PickLedger
+from stock_discovery.learning import LearningEngine
+from stock_discovery.market_context import MarketContext
+from stock_discovery.strategies import (
+    OpeningRangeBreakout,
+    VWAPPullback,
+    MomentumSwing,
+    HighVolatilityBreakout,
+    EarningsEventDrift
+)
+from stock_discovery.strategies.pick import StrategyPick
+from stock_discovery.symbol_loader import (
+    load_nifty50,
+    load_zerodha_popular,
+    SymbolLoader
+)
+from stock_discovery.technical_indicators import TechnicalIndicators
+
+logger = logging.getLogger(__name__)
+
+
+def test_config(config):
     """Test configuration"""
-    print("\nTesting configuration...")
-    
-    from config import Config
-    
-    config = Config()
-    
     assert config.TOTAL_BUDGET == 500.0
-    assert config.MIN_CONVICTION_SCORE == 75.0
+    assert config.MIN_CONVICTION_SCORE == 60.0
     assert len(config.NIFTY_SYMBOLS) > 0
     
-    print(f"  ✓ Config loaded: {len(config.NIFTY_SYMBOLS)} symbols")
-    print(f"  ✓ Symbol source: {config.SYMBOL_SOURCE}")
-    print(f"  ✓ Budget: €{config.TOTAL_BUDGET}")
-    print(f"  ✓ Min conviction: {config.MIN_CONVICTION_SCORE}")
+    logger.debug("Config loaded: %d symbols from %s", len(config.NIFTY_SYMBOLS), config.SYMBOL_SOURCE)
 
 
-def test_symbol_loader():
+def test_symbol_loader(tmp_path):
     """Test symbol loader"""
-    print("\nTesting symbol loader...")
-    
-    from symbol_loader import (
-        load_nifty50,
-        load_zerodha_popular,
-        SymbolLoader
-    )
-    
     # Test NIFTY 50 loading
     symbols = load_nifty50()
     assert len(symbols) > 0
-    assert all(s.endswith('.NS') for s in symbols)
-    print(f"  ✓ NIFTY 50 loaded: {len(symbols)} symbols")
+    assert np.char.endswith(np.asarray(symbols), '.NS').all()
+    logger.debug("NIFTY 50 loaded: %d symbols", len(symbols))
     
     # Test Zerodha popular
     symbols = load_zerodha_popular()
     assert len(symbols) > 0
-    print(f"  ✓ Zerodha popular loaded: {len(symbols)} symbols")
+    logger.debug("Zerodha popular loaded: %d symbols", len(symbols))
     
     # Test CSV creation
-    loader = SymbolLoader()
+    loader = SymbolLoader(cache_dir=str(tmp_path))
     test_symbols = ['RELIANCE', 'TCS', 'INFY']
-    loader.create_custom_list(test_symbols, 'test_symbols.csv')
+    csv_path = tmp_path / 'test_symbols.csv'
+    loader.create_custom_list(test_symbols, str(csv_path))
     
     # Verify CSV was created
-    import os
-    assert os.path.exists('test_symbols.csv')
-    print("  ✓ CSV creation works")
-    
-    # Cleanup
-    os.remove('test_symbols.csv')
-    print("  ✓ Test CSV cleaned up")
+    assert csv_path.exists()
 
 
-def test_database():
+@pytest.mark.parametrize("on_disk", [False, True], ids=["memory", "file"])
+def test_database(ledger, tmp_path, on_disk):
     """Test database operations"""
-    print("\nTesting database...")
-    
-    from database import PickLedger
-    from datetime import datetime
-    
-    ledger = PickLedger("test_ledger.db")
+    if on_disk:
+        ledger = PickLedger(str(tmp_path / "ledger.db"), fast_mode=True)
+    pick_id = f"TEST_{uuid.uuid4().hex}"
     
     # Test save pick
     test_pick = {
-        'pick_id': 'TEST_001',
+        'pick_id': pick_id,
         'symbol': 'RELIANCE.NS',
         'strategy': 'ORB',
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': '2024-01-15T09:30:00',
         'conviction_score': 85.0,
         'risk_score': 50.0,
         'entry_price': 2950.0,
@@ -129,158 +94,120 @@ def test_database():
         'features': {'test': True}
     }
     
-    pick_id = ledger.save_pick(test_pick)
-    print(f"  ✓ Pick saved: {pick_id}")
+    assert ledger.save_pick(test_pick) == pick_id
+    assert ledger.get_pick_details(pick_id)['strategy'] == 'ORB'
     
     # Test feedback
-    ledger.add_feedback('TEST_001', True, 4, "Test feedback")
-    print("  ✓ Feedback saved")
+    ledger.add_feedback(pick_id, True, 4, "Test feedback")
     
     # Test outcome
-    ledger.save_outcome('TEST_001', 5.0, -2.0, 3.5, True, False)
-    print("  ✓ Outcome saved")
-    
-    # Cleanup
-    import os
-    os.remove("test_ledger.db")
-    print("  ✓ Test database cleaned up")
+    ledger.save_outcome(pick_id, 5.0, -2.0, 3.5, True, False)
+    assert pick_id not in {p['pick_id'] for p in ledger.get_picks_without_outcomes()}
 
 
-def test_data_fetcher():
-    """Test data fetching"""
-    print("\nTesting data fetcher...")
-    
-    from data_fetcher import MarketDataFetcher
-    
+def test_data_fetcher(mock_yf):
+    """Test data fetching against recorded Yahoo responses"""
     # Test daily data
     df = MarketDataFetcher.get_stock_data("RELIANCE.NS", period="5d")
+    assert df is not None and len(df) == 5
+    assert {'datetime', 'open', 'high', 'low', 'close', 'volume'} <= set(df.columns)
     
-    if df is not None and not df.empty:
-        print(f"  ✓ Daily data fetched: {len(df)} rows")
-        print(f"  ✓ Columns: {list(df.columns)}")
-    else:
-        print("  ⚠️  Could not fetch data (may be outside market hours)")
+    # Test batched fetch
+    frames = MarketDataFetcher.get_multiple(["RELIANCE.NS", "^NSEI"], period="5d")
+    assert set(frames) == {"RELIANCE.NS", "^NSEI"}
+    assert all(len(f) == 5 and 'close' in f.columns for f in frames.values())
     
     # Test index trend
-    trend = MarketDataFetcher.get_index_trend()
-    print(f"  ✓ Index trend: {trend}")
+    assert MarketDataFetcher.get_index_trend() == "neutral"
 
 
-def test_technical_indicators():
-    """Test technical indicators"""
-    print("\nTesting technical indicators...")
-    
-    from technical_indicators import TechnicalIndicators
-    import pandas as pd
-    import numpy as np
+@pytest.mark.network
+@pytest.mark.timeout(5)
+@pytest.mark.xfail(reason="market data service flakes", strict=False)
+def test_data_fetcher_live():
+    """Test data fetching against Yahoo Finance (needs --run-network)"""
+    df = MarketDataFetcher.get_stock_data("RELIANCE.NS", period="5d")
+    assert df is not None and not df.empty
+    assert MarketDataFetcher.get_index_trend() in ("bullish", "bearish", "neutral")
+
+
+def test_market_context(fake_fetcher):
+    """Test market context on an in-memory fetcher"""
+    context = MarketContext()
+    context.fetcher = fake_fetcher
     
-    # Create sample data
-    dates = pd.date_range('2024-01-01', periods=100, freq='D')
-    df = pd.DataFrame({
-        'datetime': dates,
-        'open': np.random.randn(100).cumsum() + 100,
-        'high': np.random.randn(100).cumsum() + 102,
-        'low': np.random.randn(100).cumsum() + 98,
-        'close': np.random.randn(100).cumsum() + 100,
-        'volume': np.random.randint(100000, 1000000, 100)
-    })
+    assert context.get_index_trend() == "bullish"
+    # Stock and index share the same canned series, so they move in lockstep
+    assert context.calculate_relative_strength("RELIANCE.NS") == pytest.approx(1.0)
+
+
+def test_technical_indicators(ohlcv):
+    """Test technical indicators"""
+    df = ohlcv
     
     # Test indicators
     vwap = TechnicalIndicators.calculate_vwap(df)
-    print(f"  ✓ VWAP: {vwap:.2f}")
-    
     atr = TechnicalIndicators.calculate_atr(df)
-    print(f"  ✓ ATR: {atr:.2f}")
-    
     rsi = TechnicalIndicators.calculate_rsi(df)
-    print(f"  ✓ RSI: {rsi:.2f}")
-    
     mas = TechnicalIndicators.calculate_moving_averages(df)
-    print(f"  ✓ MA Short: {mas['ma_short']:.2f}, Long: {mas['ma_long']:.2f}")
-
-
-def test_strategies():
-    """Test strategy implementations"""
-    print("\nTesting strategies...")
-    
-    from config import Config
-    from strategies.orb_strategy import OpeningRangeBreakout
-    from strategies.vwap_strategy import VWAPPullback
-    from strategies.momentum_strategy import MomentumSwing
-    from strategies.hvb_strategy import HighVolatilityBreakout
-    
-    config = Config()
-    
-    orb = OpeningRangeBreakout(config)
-    print("  ✓ ORB strategy initialized")
     
-    vwap = VWAPPullback(config)
-    print("  ✓ VWAP strategy initialized")
+    # Golden values for tests/fixtures/sample_ohlcv.csv (simple-mean ATR/RSI over 14 bars)
+    assert vwap == pytest.approx(100.841527, rel=1e-6)
+    assert atr == pytest.approx(16.330392, rel=1e-6)
+    assert rsi == pytest.approx(45.640202, rel=1e-6)
+    assert mas['ma_short'] == pytest.approx(111.164231, rel=1e-6)
+    assert mas['ma_long'] == pytest.approx(110.827519, rel=1e-6)
+    assert mas['ma_cross']
+    
+    # The one-pass variant agrees with the individual indicators
+    combined = TechnicalIndicators.compute_all(df)
+    assert combined == pytest.approx({'vwap': vwap, 'atr': atr, 'rsi': rsi, **mas})
+    logger.debug("VWAP %.2f, ATR %.2f, RSI %.2f, MA %.2f/%.2f",
+                 vwap, atr, rsi, mas['ma_short'], mas['ma_long'])
+
+
+def _as_session(df):
+    """The sample bars replayed as a single session of 1-minute bars"""
+    return df.assign(datetime=pd.date_range("2024-03-01 09:15", periods=len(df), freq="min"))
+
+
+@pytest.mark.parametrize("strategy_cls, make_args, expected", [
+    # Daily bars as "intraday" leave a one-bar session, too short for an opening range
+    (OpeningRangeBreakout, lambda df: (df, df), None),
+    # The session closes ~9% above its VWAP, not in a pullback
+    (VWAPPullback, lambda df: (_as_session(df), df), None),
+    (MomentumSwing, lambda df: (df,), "MOMENTUM_SWING"),
+    # Volatility percentile ~29, far below the HVB floor
+    (HighVolatilityBreakout, lambda df: (df,), None),
+    # Positive earnings, but only ~1.6% drift over 10 days (needs 2%)
+    (EarningsEventDrift, lambda df: (df, {'earnings_detected': True, 'polarity': 'positive'}), None),
+], ids=["orb", "vwap", "momentum", "hvb", "earnings"])
+def test_strategies(config, ohlcv, strategy_cls, make_args, expected):
+    """Test strategy implementations"""
+    pick = strategy_cls(config).analyze('TEST.NS', *make_args(ohlcv))
     
-    momentum = MomentumSwing(config)
-    print("  ✓ Momentum strategy initialized")
+    if expected is None:
+        assert pick is None
+        return
     
-    hvb = HighVolatilityBreakout(config)
-    print("  ✓ HVB strategy initialized")
+    assert isinstance(pick, StrategyPick)
+    assert pick.strategy == expected
+    assert pick.entry_price == pytest.approx(ohlcv['close'].iloc[-1])
+    assert pick.stop_loss < pick.entry_price < pick.target_price
+    assert 0 <= pick.conviction_score <= 100
+    assert 0 <= pick.risk_score <= 100
+    assert len(pick.dimension_scores) == 7
+    assert pick.features
+    logger.debug("%s pick: conviction %.1f, risk %.1f", expected, pick.conviction_score, pick.risk_score)
 
 
-def test_learning():
+def test_learning(config, ledger):
     """Test learning engine"""
-    print("\nTesting learning engine...")
-    
-    from config import Config
-    from database import PickLedger
-    from learning import LearningEngine
-    
-    config = Config()
-    ledger = PickLedger("test_learning.db")
     learning = LearningEngine(config, ledger)
     
-    mode = learning.get_learning_mode()
-    print(f"  ✓ Learning mode: {mode}")
+    # A handful of test picks is not enough trades to start adapting
+    assert learning.get_learning_mode() == "baseline"
     
     weights = learning.get_strategy_weights()
-    print(f"  ✓ Strategy weights: {weights}")
-    
-    # Cleanup
-    import os
-    os.remove("test_learning.db")
-    print("  ✓ Test database cleaned up")
-
-
-def main():
-    """Run all tests"""
-    print("="*70)
-    print("Stock Discovery Tool - Component Tests")
-    print("="*70)
-    
-    if not test_imports():
-        return False
-    
-    try:
-        test_config()
-        test_symbol_loader()
-        test_database()
-        test_data_fetcher()
-        test_technical_indicators()
-        test_strategies()
-        test_learning()
-        
-        print("\n" + "="*70)
-        print("✅ ALL TESTS PASSED")
-        print("="*70)
-        print("\nYou can now run the scanner:")
-        print("  python main.py scan --mode intraday")
-        
-        return True
-        
-    except Exception as e:
-        print(f"\n❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
+    assert weights
+    logger.debug("Strategy weights: %s", weights)